@@ -5,21 +5,26 @@
     Python Version: 3.8
 
     This script contains the CSP class for constructing a CSP instance
-    of the 2-star constraint satisfaction problem
+    of the 2-star constraint satisfaction problem, or more generally the
+    k-star problem with k stars in every row, column and block
 """
-import numpy as np
 import time
 
+from puzzle import Puzzle
+
 
 class Csp:
     """
     A csp representation of the 2 star puzzle
 
     Attributes
+        puzzle              Immutable puzzle the csp searches, which holds the
+                                static data below and can be shared
         grid_size           Size of the grid (10x10 grid -> 10)
+        stars               number of stars in every row, column and block
         blocks              2D array representing the blocks of the grid
-        cell_map            A key value pair that maps each cell to its
-                            block and the indices of the variables
+        cell_map            read-only mapping of each cell to a Cell holding
+                                its block and the indices of the variables
         start_time          start time of the csp to keep track of its initialization
         ordering_choice     ordering choice based on the heuristic
         unassigned_vars     the list of variables that are currently unassigned
@@ -34,40 +39,51 @@ class Csp:
                                 variable. indexing is done parallel to the index of variables
         last_num_edge_list  a list that runs one iteration behind of num_edge_list for restoring
                                 vales when required
+        neighbours          the cell itself and its adjacent cells for each cell,
+                                shared with the puzzle
+        attacked            a list indexed by cell that keeps track of the number of
+                                assigned values adjacent to (or on) each cell
     """
-    def __init__(self, blocks: list, grid_size: int, ordering_choice: int):
+    __slots__ = ('puzzle', 'grid_size', 'stars', 'blocks', 'cell_map', 'start_time',
+                 'ordering_choice', 'unassigned_vars', 'domains', 'block_occupancy',
+                 'row_occupancy', 'col_occupancy', 'num_edge_list', 'last_num_edge_list',
+                 'neighbours', 'attacked')
+
+    def __init__(self, blocks, grid_size: int, ordering_choice: int, stars: int = 2):
         """
         Constructor for a csp instance
 
-        :param blocks: list of all the blocks in the grid
+        :param blocks: list of all the blocks in the grid, or a Puzzle which
+                       is then shared instead of copied
         :param grid_size: size of the input grid 
         :param ordering_choice: chosen heuristic for variable ordering (0,1,2 or 3)
-        """
-        num_stars = 2*grid_size  # for the 2 star problem
-        self.grid_size = grid_size
-        self.blocks = blocks
-        self.cell_map = {}
+        :param stars: number of stars in every row, column and block, ignored
+                      if blocks is a Puzzle
+        """
+        self.puzzle = blocks if isinstance(blocks, Puzzle) else Puzzle(blocks, grid_size, stars)
+        # static data of the puzzle, shared by every csp of the same puzzle
+        self.grid_size = grid_size = self.puzzle.grid_size
+        self.blocks = self.puzzle.blocks
+        self.cell_map = self.puzzle.cell_map
+        self.neighbours = self.puzzle.neighbours
+        self.stars = stars = self.puzzle.stars  # 2 for the 2 star problem
+        num_stars = stars*len(self.blocks)
         self.start_time = time.time()
 
         self.ordering_choice = ordering_choice  # chosen heuristic
 
-        for i, block in enumerate(blocks):
-            for cell in block:
-                self.cell_map[cell] \
-                    = {'block': i, 'in_domains_of': [2*i, 2*i + 1]}
-
         self.unassigned_vars = []
         for i in range(num_stars):
             self.unassigned_vars.append(i)
 
         self.domains = {}
         num_domains = 0
-        for block in blocks:
-            self.domains[num_domains] = set(block[:])   # deep copy required here
-            self.domains[num_domains + 1] = set(block[:])
-            num_domains += 2
+        for block in self.blocks:
+            for _ in range(stars):
+                self.domains[num_domains] = set(block)
+                num_domains += 1
 
-        self.block_occupancy = [0]*len(blocks)
+        self.block_occupancy = [0]*len(self.blocks)
         self.row_occupancy = [0]*grid_size
         self.col_occupancy = [0]*grid_size
 
@@ -75,6 +91,65 @@ class Csp:
 
         self.last_num_edge_list = [num_stars]*num_stars
 
+        self.attacked = [0]*(grid_size*grid_size + 1)
+
+    def copy(self):
+        """
+        Copy the search state of the csp. The puzzle itself is shared with
+        the copy, only the mutable bookkeeping is duplicated
+
+        :return: a new csp in the same state as this one
+        """
+        csp = Csp.__new__(Csp)
+        csp.puzzle = self.puzzle
+        csp.grid_size = self.grid_size
+        csp.blocks = self.blocks
+        csp.cell_map = self.cell_map
+        csp.neighbours = self.neighbours
+        csp.start_time = self.start_time
+        csp.ordering_choice = self.ordering_choice
+        csp.stars = self.stars
+        csp.unassigned_vars = self.unassigned_vars[:]
+        csp.domains = {var: set(domain) for var, domain in self.domains.items()}
+        csp.block_occupancy = self.block_occupancy[:]
+        csp.row_occupancy = self.row_occupancy[:]
+        csp.col_occupancy = self.col_occupancy[:]
+        csp.num_edge_list = self.num_edge_list[:]
+        csp.last_num_edge_list = self.last_num_edge_list[:]
+        csp.attacked = self.attacked[:]
+        return csp
+
+    def get_state(self):
+        """
+        Get the mutable search state of the csp in plain lists and dicts,
+        e.g. for writing it to a checkpoint
+
+        :return: dict holding the state
+        """
+        return {'unassigned_vars': self.unassigned_vars[:],
+                'domains': {var: list(domain) for var, domain in self.domains.items()},
+                'block_occupancy': self.block_occupancy[:],
+                'row_occupancy': self.row_occupancy[:],
+                'col_occupancy': self.col_occupancy[:],
+                'num_edge_list': self.num_edge_list[:],
+                'last_num_edge_list': self.last_num_edge_list[:],
+                'attacked': self.attacked[:]}
+
+    def set_state(self, state: dict):
+        """
+        Restore a search state given by get_state
+
+        :param state: dict holding the state
+        """
+        self.unassigned_vars = state['unassigned_vars'][:]
+        self.domains = {var: set(domain) for var, domain in state['domains'].items()}
+        self.block_occupancy = state['block_occupancy'][:]
+        self.row_occupancy = state['row_occupancy'][:]
+        self.col_occupancy = state['col_occupancy'][:]
+        self.num_edge_list = state['num_edge_list'][:]
+        self.last_num_edge_list = state['last_num_edge_list'][:]
+        self.attacked = state['attacked'][:]
+
     def same_row(self, value1: int, value2: int):
         """
         Check if two values are in the same row of the grid
@@ -103,7 +178,7 @@ class Csp:
         :param value2: Second value to be compared
         :return: True if the values are in the same block, False otherwise
         """
-        return self.cell_map[value1]['block'] == self.cell_map[value2]['block']
+        return self.cell_map[value1].block == self.cell_map[value2].block
 
     def is_col_occupied(self, value: int):
         """
@@ -112,7 +187,7 @@ class Csp:
         :param value: Value whose column occupancy is to be checked
         :return: True if the column is fully occupied, False otherwise
         """
-        return self.col_occupancy[(value - 1) % self.grid_size] >= 2
+        return self.col_occupancy[(value - 1) % self.grid_size] >= self.stars
 
     def is_row_occupied(self, value: int):
         """
@@ -121,7 +196,7 @@ class Csp:
         :param value: Value whose row occupancy is to be checked
         :return: True if the row is fully occupied, False otherwise
         """
-        return self.row_occupancy[(value - 1)// self.grid_size] >= 2
+        return self.row_occupancy[(value - 1)// self.grid_size] >= self.stars
 
     def is_block_occupied(self, value: int):
         """
@@ -130,8 +205,8 @@ class Csp:
         :param value: Value whose block occupancy is to be checked
         :return: True if the block is fully occupied, False otherwise
         """
-        block = self.cell_map[value]['block']
-        return self.block_occupancy[block] >= 2
+        block = self.cell_map[value].block
+        return self.block_occupancy[block] >= self.stars
 
     def are_adjacent(self, value1: int, value2: int):
         """
@@ -169,18 +244,16 @@ class Csp:
         Check if a value is consistent with an existing assignment
 
         :param value: Value whose consistency is to be checked
-        :param assignment: existing assignment for consistency check
+        :param assignment: existing assignment for consistency check. The
+                           adjacency check uses the attacked counts kept up to
+                           date by assign_val and unassign_val instead
         :return: True if the value is consistent with the assignment, 
                  False otherwise
         """
-        if self.is_col_occupied(value) or self.is_row_occupied(value) \
-                or self.is_block_occupied(value):
+        if self.attacked[value] or self.is_col_occupied(value) \
+                or self.is_row_occupied(value) or self.is_block_occupied(value):
             return False
 
-        for val in assignment.values():
-            if self.are_adjacent(value, val):
-                return False
-
         return True
 
     def is_complete(self, assignment: dict):
@@ -190,7 +263,7 @@ class Csp:
         :param assignment: Assignment to be checked
         :return: True if the assignment is complete, False otherwise
         """
-        return len(assignment) == 2*self.grid_size
+        return len(assignment) == len(self.domains)
 
     def get_next_unassigned_var(self):
         """
@@ -212,6 +285,8 @@ class Csp:
         
         # Hybrid of Heuristic 1 and Heuristic 2
         if self.ordering_choice == 3:
+            # NumPy is only imported here so headless runs don't pay its import time
+            import numpy as np
             return np.random.choice([self.get_most_constraining(),
                                     self.get_most_constrained()], p=[0.1, 0.9])
 
@@ -254,13 +329,16 @@ class Csp:
         col = (value - 1) % self.grid_size
         self.row_occupancy[row] += 1
         self.col_occupancy[col] += 1
-        block = self.cell_map[value]['block']  # the variable's block
+        block = self.cell_map[value].block  # the variable's block
         if self.ordering_choice == 2 or self.ordering_choice == 3:
             # if heuristic 2 or hybrid is chosen, edge incident is required
             # not done for heuristic 1 for performance gain
             self.last_num_edge_list = self.num_edge_list[:]
             self.incident_edges(value, row, col, assignment)
         self.block_occupancy[block] += 1
+        attacked = self.attacked
+        for cell in self.neighbours[value]:
+            attacked[cell] += 1
         self.safe_remove_list(self.unassigned_vars, var)
 
     def unassign_val(self, var: int, value: int, assignment: dict):
@@ -277,8 +355,11 @@ class Csp:
         col = (value - 1) % self.grid_size
         self.row_occupancy[row] -= 1
         self.col_occupancy[col] -= 1
-        block = self.cell_map[value]['block']  # the variable's block
+        block = self.cell_map[value].block  # the variable's block
         self.block_occupancy[block] -= 1 
+        attacked = self.attacked
+        for cell in self.neighbours[value]:
+            attacked[cell] -= 1
         if self.ordering_choice == 2 or self.ordering_choice == 3:
             self.num_edge_list = self.last_num_edge_list[:]
         self.unassigned_vars.append(var)
@@ -293,11 +374,11 @@ class Csp:
         """
         if cell not in self.cell_map:
             return
-        incident_block = self.cell_map[cell]['block']
-        if 2*incident_block not in assignment:
-            self.num_edge_list[2*incident_block] -= 1
-        elif 2*incident_block + 1 not in assignment:
-            self.num_edge_list[2*incident_block + 1] -= 1
+        # the first variable of the block that's still unassigned
+        for var in self.cell_map[cell].in_domains_of:
+            if var not in assignment:
+                self.num_edge_list[var] -= 1
+                break
 
     def incident_edges(self, value: int, row: int, col: int, assignment: dict):
         """
@@ -0,0 +1,57 @@
+import json
+import os
+
+import numpy as np
+
+from batch_verify import check_batch, load_batch, stack_regions, stack_stars, verify_batch
+from puzzle import Puzzle
+from puzzle_corpus import load_json_corpus
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+EXAMPLES_10X10 = os.path.join(HERE, '..', 'Examples', 'examples10x10.json')
+
+
+def test_verify_corpus_solutions():
+    names, regions, stars, star_counts = load_batch(EXAMPLES_10X10)[10]
+    assert regions.shape == stars.shape == (len(names), 10, 10)
+    assert verify_batch(regions, stars, star_counts).all()
+
+    # moving one star a cell to the right breaks the solutions
+    moved = np.roll(stars, 1, axis=2)
+    checks = check_batch(regions, moved, star_counts)
+    assert not checks['valid'].any()
+    assert checks['rows'].all()
+
+
+def test_unsolved_entry(tmp_path):
+    entries = load_json_corpus(EXAMPLES_10X10)[:3]
+    del entries[1]['puzzle_data']['solved']
+    path = str(tmp_path / 'unsolved.json')
+    with open(path, 'w') as file:
+        json.dump(entries, file)
+
+    names, regions, stars, star_counts = load_batch(path)[10]
+    assert stars.shape == (3, 10, 10) and not stars[1].any()
+    assert verify_batch(regions, stars, star_counts).tolist() == [True, False, True]
+
+
+def test_adjacency():
+    # every row is its own block, one star per row
+    stripes = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 16]]
+    regions = stack_regions([stripes, Puzzle(stripes, 4, 1)] * 3, 4)
+    # two solutions, then stars touching diagonally both ways, vertically
+    # and horizontally
+    stars = stack_stars([[2, 8, 9, 15], '0010100000010100',
+                         [1, 7, 12, 14], [3, 6, 12, 13],
+                         [2, 6, 12, 13], [1, 2, 12, 14]], 4)
+    checks = check_batch(regions, stars, 1)
+    assert checks['valid'].tolist() == [True, True, False, False, False, False]
+    assert checks['rows'].tolist() == [True, True, True, True, True, False]
+    assert checks['blocks'].tolist() == checks['rows'].tolist()
+    assert checks['columns'].tolist() == [True, True, True, True, False, False]
+    assert checks['adjacency'].tolist() == [True, True, False, False, False, False]
+
+    # partial placements only need to not overfill anything
+    partial = stack_stars([[2], [], [2, 12], [2, 7], [2, 3], [1, 16]], 4)
+    assert check_batch(regions, partial, 1, partial=True)['valid'].tolist() == \
+        [True, True, True, False, False, True]
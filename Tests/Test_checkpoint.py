@@ -0,0 +1,64 @@
+import os
+
+import backtrack as backtrack_module
+
+from backtrack import backtrack, resume_backtrack
+from checkpoint import load_checkpoint, resume
+from forward_checking import forward_check
+from grid_file_loader import load_grid_file
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+GRID_8X8 = os.path.join(HERE, '..', 'grid8x8.txt')
+GRID_10X10 = os.path.join(HERE, '..', 'grid10x10.txt')
+
+
+def solve_in_slices(solver, path, *args):
+    result = solver(*args, time_limit=0.02, checkpoint=path, checkpoint_interval=0.005)
+    slices = 1
+    while result and result[0] is None:
+        assert load_checkpoint(path)['result'] is None
+        result = resume(path, 0.02, 0.005)
+        slices += 1
+    return result, slices
+
+
+def test_backtrack_slices(tmp_path):
+    path = str(tmp_path / 'bt.ckpt')
+    blocks, grid_size = load_grid_file(GRID_10X10)
+    assignment, nodes = backtrack(blocks, grid_size, 1)
+
+    (sliced, sliced_nodes), slices = solve_in_slices(backtrack, path, blocks, grid_size, 1)
+    assert slices > 1
+    # backtracking never changes the domains, so the slices visit the same nodes
+    assert sliced == assignment and sliced_nodes == nodes
+
+    saved = load_checkpoint(path)
+    assert saved['result'] == (assignment,) and saved['frames'] == []
+    # resuming a finished search gives its result again
+    assert resume_backtrack(path) == (assignment, nodes)
+
+
+def test_forward_check_slices(tmp_path):
+    path = str(tmp_path / 'fc.ckpt')
+    blocks, grid_size = load_grid_file(GRID_8X8)
+    assignment, _ = forward_check(blocks, grid_size, 2)
+
+    (sliced, _), slices = solve_in_slices(forward_check, path, blocks, grid_size, 2)
+    assert slices > 1
+    assert sorted(sliced.values()) == sorted(assignment.values())
+    assert load_checkpoint(path)['algorithm'] == 'fc'
+
+
+def test_progress_after_resume(tmp_path, capsys):
+    path = str(tmp_path / 'bt.ckpt')
+    blocks, grid_size = load_grid_file(GRID_10X10)
+    result = backtrack(blocks, grid_size, 1, time_limit=0.1, checkpoint=path)
+    while result and result[0] is None:
+        # as in a fresh process resuming the search
+        backtrack_module.curr_print_threshold = backtrack_module.PRINT_THRESHOLD_INCREMENT
+        result = resume_backtrack(path, 0.1)
+    counts = [int(line.split()[1]) for line in capsys.readouterr().out.splitlines()
+              if line.startswith('Checked')]
+    # one message per hundred thousand nodes, never repeated by a resumed slice
+    hundreds = [count // backtrack_module.PRINT_THRESHOLD_INCREMENT for count in counts]
+    assert hundreds == sorted(set(hundreds)) and len(hundreds) == result[1] // 100000
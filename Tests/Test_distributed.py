@@ -0,0 +1,50 @@
+import json
+import os
+import socket
+
+from distributed import Coordinator, send_message, start_local_workers
+from puzzle_corpus import load_json_corpus
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CORPUS_10X10 = os.path.join(HERE, '..', 'Examples', 'examples10x10.json')
+
+
+def wait_for(processes):
+    for process in processes:
+        assert process.wait(timeout=30) == 0
+
+
+def test_local_workers():
+    entries = load_json_corpus(CORPUS_10X10)[:6]
+    coordinator = Coordinator(entries, 'fc', 1, chunk_size=2, host='localhost', port=0)
+    processes = start_local_workers(2, coordinator.port)
+    results = coordinator.run(timeout=60)
+    wait_for(processes)
+
+    assert [result['index'] for result in results] == list(range(6))
+    assert all(result['solved'] and result['matches_corpus'] for result in results)
+    assert all(result['checked_nodes'] > 0 for result in results)
+    rows = coordinator.worker_rows()
+    assert sum(row[1] for row in rows) == 3 and sum(row[2] for row in rows) == 6
+
+
+def test_dead_worker_chunk_reassigned():
+    entries = load_json_corpus(CORPUS_10X10)[:4]
+    coordinator = Coordinator(entries, 'bt', 1, chunk_size=2, host='localhost', port=0,
+                              heartbeat_timeout=0.5)
+    coordinator.start()
+    # takes the first chunk and never answers again
+    silent = socket.create_connection(('localhost', coordinator.port))
+    send_message(silent, {'type': 'request', 'worker': 'silent'})
+    chunk = json.loads(silent.makefile('r').readline())
+    assert chunk['type'] == 'chunk' and chunk['chunk'] == 0
+
+    processes = start_local_workers(1, coordinator.port, heartbeat_interval=0.1)
+    results = coordinator.run(timeout=60)
+    wait_for(processes)
+    silent.close()
+
+    assert all(result['solved'] and result['worker'] == 'local-0' for result in results)
+    rows = {row[0]: row for row in coordinator.worker_rows()}
+    assert rows['silent'][1:3] == [0, 0] and rows['silent'][5] == 1
+    assert rows['local-0'][1:3] == [2, 4]
@@ -0,0 +1,34 @@
+import os
+
+from frontier_dp import count_solutions, frontier_solve
+from grid_file_loader import load_grid_file
+from puzzle_corpus import entry_blocks, load_json_corpus
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+EXAMPLES_10X10 = os.path.join(HERE, '..', 'Examples', 'examples10x10.json')
+
+
+def test_count_solutions():
+    blocks, grid_size = load_grid_file(os.path.join(HERE, '..', 'grid8x8.txt'))
+    count, layer_sizes = count_solutions(blocks, grid_size)
+    assert count == 1
+    assert len(layer_sizes) == grid_size
+
+    blocks, grid_size = load_grid_file(os.path.join(HERE, 'grid8x8.txt'))
+    assert count_solutions(blocks, grid_size)[0] == 0
+
+    # every row is its own block, so 1 star per row is a permutation with
+    # no two neighbouring rows having stars in neighbouring columns
+    stripes = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 16]]
+    assert count_solutions(stripes, 4, 1)[0] == 2
+    assert count_solutions(stripes, 4, 2)[0] == 0
+
+
+def test_frontier_solve():
+    for entry in load_json_corpus(EXAMPLES_10X10)[:3]:
+        blocks, grid_size, _ = entry_blocks(entry)
+        assignment, transitions = frontier_solve(blocks, grid_size)
+        assert sorted(assignment.values()) == \
+            [i + 1 for i, char in enumerate(entry['puzzle_data']['solved']) if char == '1']
+        for var, cell in assignment.items():
+            assert cell in blocks[var // 2]
@@ -0,0 +1,47 @@
+import os
+
+from grid_file_loader import load_grid_file
+from grid_render import border_segments, file_name, grid_segments, region_grid, render_many
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+GRID_8X8 = os.path.join(HERE, '..', 'grid8x8.txt')
+
+
+def segment_set(segments):
+    return set(tuple(map(tuple, segment.astype(int).tolist())) for segment in segments)
+
+
+def test_border_segments():
+    blocks, grid_size = load_grid_file(GRID_8X8)
+    block_of = {cell: i for i, block in enumerate(blocks) for cell in block}
+    expected = set()
+    for row in range(grid_size):
+        for col in range(grid_size):
+            cell = row*grid_size + col + 1
+            if col + 1 < grid_size and block_of[cell] != block_of[cell + 1]:
+                expected.add(((col + 1, row), (col + 1, row + 1)))
+            if row + 1 < grid_size and block_of[cell] != block_of[cell + grid_size]:
+                expected.add(((col, row + 1), (col + 1, row + 1)))
+
+    segments = border_segments(region_grid(blocks, grid_size))
+    assert len(segments) == len(expected)
+    assert segment_set(segments) == expected
+    assert len(grid_segments(grid_size)) == 2*(grid_size + 1)
+
+
+def test_file_name():
+    assert file_name(3, 'corpora/grid 8x8.txt', 'png') == '00003_grid_8x8.png'
+    assert file_name(12, 'KD_Star:10/P1', 'svg') == '00012_P1.svg'
+
+
+def test_render_many(tmp_path):
+    blocks, grid_size = load_grid_file(GRID_8X8)
+    results = [('second', blocks, grid_size, [1, 3]), ('first', blocks, grid_size, [])]
+    for image_format in 'png', 'svg':
+        paths = render_many(results, str(tmp_path / image_format), image_format,
+                            processes=2, size=2)
+        assert [os.path.basename(path) for path in paths] == \
+            ['00000_second.' + image_format, '00001_first.' + image_format]
+        assert all(os.path.getsize(path) > 0 for path in paths)
+    with open(paths[0]) as file:
+        assert '<svg' in file.read()
@@ -0,0 +1,44 @@
+import os
+
+from local_search import local_search
+from puzzle_generator import generate_puzzle
+from puzzle_corpus import entry_blocks, load_json_corpus
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Examples')
+
+
+def load_examples(name: str, count: int):
+    puzzles = []
+    for entry in load_json_corpus(os.path.join(EXAMPLES, name))[:count]:
+        solution = [i + 1 for i, char in enumerate(entry['puzzle_data']['solved']) if char == '1']
+        puzzles.append(entry_blocks(entry) + (solution,))
+    return puzzles
+
+
+def test_local_search_2_stars():
+    for blocks, grid_size, stars, solution in load_examples('examples10x10.json', 5):
+        assignment, steps = local_search(blocks, grid_size, stars, seed=0)
+        assert sorted(assignment.values()) == solution
+        assert sorted(assignment) == list(range(2*grid_size))
+
+
+def test_local_search_3_stars():
+    blocks, grid_size, stars, solution = load_examples('examples14x14.json', 1)[0]
+    assignment, steps = local_search(blocks, grid_size, stars, seed=0)
+    assert sorted(assignment.values()) == solution
+
+
+def test_local_search_gives_up():
+    blocks, grid_size, stars, solution = load_examples('examples10x10.json', 1)[0]
+    assignment, steps = local_search(blocks, grid_size, stars, max_steps=1, seed=0)
+    assert assignment is None and steps == 1
+
+
+def test_local_search_single_cell_block():
+    blocks, solution = generate_puzzle(8, 1, seed=0)
+    assert any(len(block) == 1 for block in blocks)
+    # the star of a single cell block has nowhere to walk to
+    assignment, steps = local_search(blocks, 8, 1, seed=0, walk_probability=0.5)
+    assert assignment is not None
+    for block, star in zip(blocks, sorted(assignment)):
+        assert assignment[star] in block
@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from CSP import Csp
+from backtrack import backtrack
+from forward_checking import forward_check
+from grid_file_loader import load_grid_file
+from profiling import PHASES, Profiler
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+GRID_8X8 = os.path.join(HERE, '..', 'grid8x8.txt')
+
+
+def test_enable_disable():
+    originals = {phase: Csp.__dict__[phase] for phase in PHASES}
+    profiler = Profiler()
+    with profiler:
+        assert all(Csp.__dict__[phase] is not originals[phase] for phase in PHASES)
+        # a second profiler can't wrap the wrappers
+        with pytest.raises(RuntimeError):
+            Profiler().enable()
+    assert all(Csp.__dict__[phase] is originals[phase] for phase in PHASES)
+
+
+def test_profiled_run():
+    blocks, grid_size = load_grid_file(GRID_8X8)
+    _, plain_nodes = backtrack(blocks, grid_size, 1)
+
+    profiler = Profiler(sample_every=4)
+    assignment, nodes = profiler.run('bt', backtrack, blocks, grid_size, 1)
+    assert assignment and nodes == plain_nodes
+    stats = profiler.stats['bt']
+    # backtracking checks the consistency of every node it visits
+    assert stats['is_consistent'].calls == nodes
+    assert stats['is_consistent'].sampled == nodes // 4
+    assert stats['propagate_constraints'].calls == 0
+
+    profiler.run('fc', forward_check, blocks, grid_size, 1)
+    assert profiler.stats['fc']['propagate_constraints'].calls > 0
+    assert len(profiler.summary_rows()) == 6
+    lines = profiler.collapsed_stacks()
+    assert 'bt;is_consistent' in [line.split(' ')[0] for line in lines]
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
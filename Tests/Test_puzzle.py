@@ -0,0 +1,74 @@
+import os
+import pickle
+
+import pytest
+
+from CSP import Csp
+from grid_file_loader import load_grid_file
+from puzzle import Puzzle
+
+GRID_8X8 = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'grid8x8.txt')
+
+
+def init_puzzle():
+    blocks, grid_length = load_grid_file(GRID_8X8)
+    return Puzzle(blocks, grid_length)
+
+
+def test_blocks():
+    blocks, grid_length = load_grid_file(GRID_8X8)
+    puzzle = Puzzle(blocks, grid_length)
+    assert [list(block) for block in puzzle.blocks] == [sorted(block) for block in blocks]
+    assert puzzle.cell_map[48] == (6, (12, 13)) and puzzle.cell_map[48].block == 6
+
+
+def test_immutable():
+    puzzle = init_puzzle()
+    with pytest.raises(AttributeError):
+        puzzle.grid_size = 10
+    with pytest.raises(AttributeError):
+        puzzle.extra = 1
+    with pytest.raises(TypeError):
+        puzzle.regions[0] = 5
+    with pytest.raises(TypeError):
+        puzzle.cell_map[1] = puzzle.cell_map[2]
+    with pytest.raises(AttributeError):
+        puzzle.cell_map[1].block = 9
+
+
+def test_pickle():
+    puzzle = init_puzzle()
+    data = pickle.dumps(puzzle)
+    assert len(data) < 3*8*8
+    assert pickle.loads(data) == puzzle
+
+
+def test_shared_by_csps():
+    puzzle = init_puzzle()
+    csp = Csp(puzzle, puzzle.grid_size, 1)
+    other = Csp(puzzle, puzzle.grid_size, 1)
+    assert csp.cell_map is other.cell_map
+
+    copy = csp.copy()
+    csp.assign_val(0, 1, {})
+    assert copy.puzzle is csp.puzzle
+    assert copy.row_occupancy[0] == 0 and 0 in copy.unassigned_vars
+
+
+TEST_NEIGHBOURS = [(1, (1, 2, 9, 10)), (8, (7, 8, 15, 16)),
+                   (10, (1, 2, 3, 9, 10, 11, 17, 18, 19)), (64, (55, 56, 63, 64))]
+
+
+def test_attacked_counts():
+    puzzle = init_puzzle()
+    for cell, neighbours in TEST_NEIGHBOURS:
+        assert puzzle.neighbours[cell] == neighbours
+
+    csp = Csp(puzzle, puzzle.grid_size, 1)
+    assignment = {}
+    csp.assign_val(0, 10, assignment)
+    for cell in range(1, 65):
+        assert csp.is_consistent(cell, assignment) != csp.are_adjacent(10, cell) \
+            or csp.is_row_occupied(cell) or csp.is_block_occupied(cell)
+    csp.unassign_val(0, 10, assignment)
+    assert not any(csp.attacked)
@@ -0,0 +1,69 @@
+import json
+import os
+
+from puzzle_corpus import CorpusReader, corpus_to_json, entry_blocks, json_to_corpus, \
+    grid_files_to_corpus, load_json_corpus, record_size
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+EXAMPLES_10X10 = os.path.join(HERE, '..', 'Examples', 'examples10x10.json')
+EXAMPLES_14X14 = os.path.join(HERE, '..', 'Examples', 'examples14x14.json')
+GRID_8X8 = os.path.join(HERE, 'grid8x8.txt')
+
+
+def test_json_round_trip(tmp_path):
+    # examples14x14.json ends with a stray semicolon and has 3-star puzzles
+    for path in EXAMPLES_10X10, EXAMPLES_14X14:
+        corpus_path = str(tmp_path / 'examples.spc')
+        json_path = str(tmp_path / 'examples.json')
+        count = json_to_corpus(path, corpus_path)
+        assert corpus_to_json(corpus_path, json_path) == count
+
+        expected = load_json_corpus(path)
+        with open(json_path) as file:
+            actual = json.load(file)
+        assert len(actual) == len(expected)
+        for original, converted in zip(expected, actual):
+            assert converted['puzzle_id'] == original['puzzle_id']
+            for key in 'puzz', 'solved', 'width', 'stars':
+                assert converted['puzzle_data'][key] == original['puzzle_data'][key]
+
+
+def test_random_access(tmp_path):
+    corpus_path = str(tmp_path / 'examples.spc')
+    json_to_corpus(EXAMPLES_10X10, corpus_path)
+    with open(EXAMPLES_10X10) as file:
+        expected = json.load(file)
+
+    # single grid size, so records are fixed size
+    assert os.path.getsize(corpus_path) == 12 + len(expected)*(8 + record_size(10, 10))
+
+    with CorpusReader(corpus_path) as reader:
+        assert len(reader) == len(expected)
+        puzzle = reader[-1]
+        data = expected[-1]['puzzle_data']
+        assert puzzle.grid_size == 10 and puzzle.stars == 2
+        assert puzzle.puzz_string() == data['puzz']
+        assert len(puzzle.star_cells()) == 20
+        assert [view.index for view in reader[2:8:3]] == [2, 5]
+        blocks = reader[0].blocks()
+        assert sorted(cell for block in blocks for cell in block) == list(range(1, 101))
+
+
+def test_grid_files(tmp_path):
+    corpus_path = str(tmp_path / 'grids.spc')
+    assert grid_files_to_corpus([GRID_8X8], corpus_path) == 1
+    with CorpusReader(corpus_path) as reader:
+        assert reader[0].grid_size == 8
+        assert not reader[0].has_solution
+        assert reader[0].blocks()[1] == [9, 10, 11, 12, 13, 17, 18, 19]
+
+
+def test_entry_blocks(tmp_path):
+    corpus_path = str(tmp_path / 'examples.spc')
+    json_to_corpus(EXAMPLES_10X10, corpus_path)
+    entries = load_json_corpus(EXAMPLES_10X10)
+    with CorpusReader(corpus_path) as reader:
+        for entry, puzzle in zip(entries, reader):
+            blocks, grid_size, stars = entry_blocks(entry)
+            assert (grid_size, stars) == (10, 2)
+            assert blocks == [list(block) for block in puzzle.blocks()]
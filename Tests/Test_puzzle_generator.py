@@ -0,0 +1,36 @@
+from backtrack import backtrack
+from forward_checking import forward_check
+from puzzle import Puzzle
+from puzzle_generator import generate_puzzle
+
+
+def is_solution(puzzle, cells):
+    stars, grid_size = puzzle.stars, puzzle.grid_size
+    for i in range(grid_size):
+        if sum(1 for cell in cells if (cell - 1) // grid_size == i) != stars or \
+                sum(1 for cell in cells if (cell - 1) % grid_size == i) != stars:
+            return False
+    if any(sum(1 for cell in cells if cell in block) != stars for block in puzzle.blocks):
+        return False
+    return not any(a != b and b in puzzle.neighbours[a] for a in cells for b in cells)
+
+
+def test_generate_puzzle():
+    for grid_size, stars in ((8, 1), (10, 2), (14, 3)):
+        blocks, solution = generate_puzzle(grid_size, stars, seed=grid_size)
+        puzzle = Puzzle(blocks, grid_size, stars)
+        assert len(puzzle.blocks) == grid_size
+        assert is_solution(puzzle, solution)
+        assert generate_puzzle(grid_size, stars, seed=grid_size) == (blocks, solution)
+
+
+def test_solvers_with_k_stars():
+    for grid_size, stars in ((8, 1), (10, 1), (10, 2)):
+        blocks, _ = generate_puzzle(grid_size, stars, seed=grid_size)
+        puzzle = Puzzle(blocks, grid_size, stars)
+        for solver in (backtrack, forward_check):
+            assignment, _ = solver(blocks, grid_size, 1, stars)
+            assert len(assignment) == stars*grid_size
+            assert is_solution(puzzle, list(assignment.values()))
+            for var, cell in assignment.items():
+                assert cell in puzzle.blocks[var // stars]
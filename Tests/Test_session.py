@@ -0,0 +1,57 @@
+import os
+
+from puzzle_corpus import entry_blocks, load_json_corpus
+from session import SolveSession, STAR
+
+EXAMPLES_10X10 = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              '..', 'Examples', 'examples10x10.json')
+
+
+def init_session():
+    entry = load_json_corpus(EXAMPLES_10X10)[3]
+    blocks, grid_size, _ = entry_blocks(entry)
+    solution = [i + 1 for i, char in enumerate(entry['puzzle_data']['solved']) if char == '1']
+    return SolveSession(blocks, grid_size), solution
+
+
+def test_hints_solve_the_puzzle():
+    session, solution = init_session()
+    move = session.hint()
+    while move is not None:
+        kind, cell = move
+        if kind == STAR:
+            assert session.place_star(cell)
+        else:
+            assert session.mark_empty(cell)
+        move = session.hint()
+    assert session.stars == solution
+
+
+def test_contradiction_and_removal():
+    session, solution = init_session()
+    assert session.place_star(1)
+    assert not session.place_star(2)    # adjacent to the first star
+    assert not session.is_consistent()
+    assert session.remove_star(2)
+    assert session.stars == [1]
+
+
+def test_is_solvable():
+    session, solution = init_session()
+    assert session.is_solvable()
+    session.mark_empty(solution[0])     # the puzzle has a single solution
+    assert not session.is_solvable()
+    session.unmark_empty(solution[0])
+    assert session.place_star(solution[0])
+    assert session.is_solvable()
+    assert session.next_forced_move() is not None
+
+
+def test_no_hint_on_unsolvable_board():
+    session, solution = init_session()
+    # a star outside the unique solution that breaks no rule yet
+    cell = next(cell for cell in range(1, 101) if cell not in solution
+                and init_session()[0].place_star(cell))
+    assert session.place_star(cell)
+    assert not session.is_solvable()
+    assert session.hint() is None
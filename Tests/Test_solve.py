@@ -0,0 +1,14 @@
+import os
+
+from grid_file_loader import load_grid_file
+from solve import solve_puzzle
+
+GRID_8X8 = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'grid8x8.txt')
+
+
+def test_nodes_without_solution():
+    # this grid has no solution, so bt and fc search everything
+    blocks, grid_size = load_grid_file(GRID_8X8)
+    for algorithm in ('bt', 'fc'):
+        assignment, checked_nodes, run_time = solve_puzzle(blocks, grid_size, algorithm, 1)
+        assert assignment == {} and checked_nodes > 0
@@ -14,55 +14,135 @@
 import time
 
 from CSP import Csp
+from checkpoint import CHECKPOINT_INTERVAL, Checkpoints, load_checkpoint
 
 PRINT_THRESHOLD_INCREMENT = 100000
+TIME_LIMIT = 10*60  # seconds
 
 checked_nodes = 0
+curr_time_limit = TIME_LIMIT
 curr_print_threshold = PRINT_THRESHOLD_INCREMENT
+checkpoints = Checkpoints('bt')  # checkpoints and search path of the current search
 
 
-def backtrack(blocks: list, grid_size: int, heuristic: int):
+def backtrack(blocks: list, grid_size: int, heuristic: int, stars: int = 2,
+              time_limit: float = TIME_LIMIT, checkpoint: str = None,
+              checkpoint_interval: float = CHECKPOINT_INTERVAL):
     """
     Constructs a new csp object and calls the recursive backtracking algorithm
     to solve the problem
 
-    :param blocks: 2-D array containing the blocks, and their contents.
+    :param blocks: 2-D array containing the blocks, and their contents,
+                   or a Puzzle shared between searches
     :param grid_size: Size of the grid (10x10 grid -> 10)
     :param heuristic: The heuristic to be used for the algorithm
+    :param stars: number of stars in every row, column and block
+    :param time_limit: number of seconds after which the search gives up
+    :param checkpoint: file to write checkpoints of the search to, every
+                       checkpoint_interval seconds and when the time limit is
+                       reached, so it can be carried on by resume_backtrack
+    :param checkpoint_interval: seconds between checkpoints
     :return: A valid solution of the 2-star csp
     """
-    global checked_nodes
+    global checked_nodes, curr_time_limit, checkpoints
     checked_nodes = 0
-    return recursive_backtrack({}, Csp(blocks, grid_size, heuristic))
+    curr_time_limit = time_limit
+    csp = Csp(blocks, grid_size, heuristic, stars)
+    checkpoints = Checkpoints('bt', checkpoint, checkpoint_interval)
+    result = recursive_backtrack({}, csp)
+    # searches started directly from the recursive function get the default
+    curr_time_limit = TIME_LIMIT
+    return checkpoints.finish(result, csp, checked_nodes)
 
 
-def recursive_backtrack(assignment: dict, csp: Csp):
+def resume_backtrack(checkpoint: str, time_limit: float = TIME_LIMIT,
+                     checkpoint_interval: float = CHECKPOINT_INTERVAL):
+    """
+    Carries on a search from a checkpoint written by backtrack or by an
+    earlier call of this function, updating the checkpoint as it goes
+
+    :param checkpoint: checkpoint file of the search
+    :param time_limit: number of seconds after which this slice gives up
+    :param checkpoint_interval: seconds between checkpoints
+    :return: A valid solution of the 2-star csp, the same as backtrack, with
+             the nodes checked over all slices
+    """
+    global checked_nodes, curr_time_limit, curr_print_threshold, checkpoints
+    saved = load_checkpoint(checkpoint)
+    if saved['algorithm'] != 'bt':
+        raise ValueError('{} is a checkpoint of {}, not bt'.format(checkpoint, saved['algorithm']))
+    if saved['result'] is not None:
+        # the search already ended
+        assignment = saved['result'][0]
+        return (assignment, saved['checked_nodes']) if assignment else None
+
+    checked_nodes = saved['checked_nodes']
+    # the next progress message is the first one past the nodes checked so far
+    curr_print_threshold = checked_nodes - checked_nodes % PRINT_THRESHOLD_INCREMENT \
+        + PRINT_THRESHOLD_INCREMENT
+    curr_time_limit = time_limit
+    csp = Csp(saved['puzzle'], saved['puzzle'].grid_size, saved['heuristic'])
+    csp.set_state(saved['state'])
+    checkpoints = Checkpoints('bt', checkpoint, checkpoint_interval, saved['elapsed'])
+    result = recursive_backtrack(saved['assignment'], csp, saved['frames'])
+    curr_time_limit = TIME_LIMIT
+    return checkpoints.finish(result, csp, checked_nodes)
+
+
+def recursive_backtrack(assignment: dict, csp: Csp, resume_path: list = None):
     """
     Recursively attempts to solve the 2-star csp using backtracking
     :param assignment: Current assignment for the 2-star csp
     :param csp: 2-star csp object for the current recursion level
+    :param resume_path: levels of a checkpoint to carry on from, starting
+                        with this one, None to start this level afresh
     :return assignment: A valid solution of the 2-star csp, if no solution, then return None
     :return checked_nodes: The number of nodes checked while attempting to find a solution
     """
     global checked_nodes, curr_print_threshold, PRINT_THRESHOLD_INCREMENT
-    
-    if csp.is_complete(assignment):
-        return assignment, checked_nodes
-
-    var = csp.get_next_unassigned_var()  # csp object takes care of the heuristic check by itself
-    
-    for value in csp.domains[var]:
-        checked_nodes += 1
-        if csp.is_consistent(value, assignment):
-            csp.assign_val(var, value, assignment)  # adding to the assignment, updating other variables as required
-            result = recursive_backtrack(assignment, csp)  # continue to next recusrion level
+
+    if resume_path:
+        var, values, start, _ = resume_path[0]
+        # with levels below it, the value at start is already assigned
+        deeper = resume_path[1:]
+    else:
+        if csp.is_complete(assignment):
+            return assignment, checked_nodes
+        var = csp.get_next_unassigned_var()  # csp object takes care of the heuristic check by itself
+        values, start, deeper = list(csp.domains[var]), 0, None
+
+    frame = [var, values, start, None]
+    search_path = checkpoints.search_path
+    search_path.append(frame)
+    for i in range(start, len(values)):
+        value = values[i]
+        frame[2] = i
+        if deeper:
+            searched = True
+            result = recursive_backtrack(assignment, csp, deeper)  # carry on below the checkpoint
+            deeper = None
+        else:
+            checked_nodes += 1
+            searched = csp.is_consistent(value, assignment)
+            if searched:
+                csp.assign_val(var, value, assignment)  # adding to the assignment, updating other variables as required
+                result = recursive_backtrack(assignment, csp)  # continue to next recusrion level
+        if searched:
             if result:
+                search_path.pop()
                 return result   # found a valid assignment
             csp.unassign_val(var, value, assignment)  # deleting from the assignment
-        # If the time taken is more than 10 mins, return no solution
-        if (time.time() - csp.start_time) / 60 >= 10:
+        now = time.time()
+        # If the time taken is more than the time limit (10 mins by default), return no solution
+        if now - csp.start_time >= curr_time_limit:
+            if checkpoints.path is not None:
+                checkpoints.write(csp, assignment, checked_nodes)
+            search_path.pop()
             return None, checked_nodes
-    
+        if checkpoints.path is not None and now >= checkpoints.next_time:
+            checkpoints.write(csp, assignment, checked_nodes)
+    search_path.pop()
+
     if checked_nodes >= curr_print_threshold:
         print('Checked {0} states so far'.format(checked_nodes))
         curr_print_threshold += PRINT_THRESHOLD_INCREMENT
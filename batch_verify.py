@@ -0,0 +1,252 @@
+"""
+    File name: batch_verify.py
+    Author: Arsh Khokhar, Kiernan Wiese
+    Date last modified: 19 October, 2026
+    Python Version: 3.8
+
+    This script contains a vectorized verifier that checks many candidate
+    solutions at once. The puzzles are stacked into an (N, H, W) array of
+    block ids and the candidates into an (N, H, W) boolean array of stars;
+    the row, column and block counts are array reductions and the adjacency
+    rule is a comparison of the star grids with shifted copies of themselves,
+    so no Python code runs per cell. It is used to validate the output of
+    batch solves against a corpus and to fuzz the solvers against each other.
+"""
+
+import argparse
+import json
+
+import numpy as np
+
+from puzzle_corpus import CorpusReader, load_json_corpus
+
+# (row, column) offsets of half the neighbours of a cell, the other half
+# is covered by the same comparison seen from the neighbour
+NEIGHBOUR_OFFSETS = [(0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def stack_regions(puzzles: list, grid_size: int):
+    """
+    Stacks the block ids of puzzles of the same size into one array
+
+    :param puzzles: list of puzzles, each a 2D list of blocks, a Puzzle or a
+                    PuzzleView of a binary corpus
+    :param grid_size: Size of the grids (10x10 grid -> 10)
+    :return: (N, grid_size, grid_size) array of block ids
+    """
+    regions = np.empty((len(puzzles), grid_size*grid_size), dtype=np.int32)
+    for i, puzzle in enumerate(puzzles):
+        if hasattr(puzzle, 'regions'):
+            regions[i] = np.frombuffer(puzzle.regions, dtype=np.uint8)
+        else:
+            for j, block in enumerate(puzzle):
+                regions[i, np.asarray(block) - 1] = j
+    return regions.reshape(len(puzzles), grid_size, grid_size)
+
+
+def stack_stars(star_locs: list, grid_size: int):
+    """
+    Stacks the candidate solutions of puzzles of the same size into one array
+
+    :param star_locs: list of candidates, each a list of the cells with stars
+                      (numbered from 1) or a string with '1' for every star
+    :param grid_size: Size of the grids (10x10 grid -> 10)
+    :return: (N, grid_size, grid_size) boolean array, True where there's a star
+    """
+    stars = np.zeros((len(star_locs), grid_size*grid_size), dtype=bool)
+    for i, locs in enumerate(star_locs):
+        if isinstance(locs, str):
+            stars[i] = np.frombuffer(locs.encode(), dtype=np.uint8) == ord('1')
+        elif len(locs):
+            stars[i, np.asarray(locs) - 1] = True
+    return stars.reshape(len(star_locs), grid_size, grid_size)
+
+
+def block_counts(regions: np.ndarray, stars: np.ndarray):
+    """
+    :return: (N, number of blocks) array with the number of stars in every
+             block of every puzzle
+    """
+    num_puzzles = regions.shape[0]
+    num_blocks = max(regions.shape[1], int(regions.max()) + 1 if regions.size else 0)
+    # offsetting the block ids of every puzzle makes them unique in the batch
+    ids = regions + num_blocks*np.arange(num_puzzles).reshape(-1, 1, 1)
+    counts = np.bincount(ids[stars], minlength=num_puzzles*num_blocks)
+    return counts.reshape(num_puzzles, num_blocks)
+
+
+def adjacent_stars(stars: np.ndarray):
+    """
+    :return: (N,) boolean array, True for the candidates with two stars next
+             to each other, horizontally, vertically or diagonally
+    """
+    height, width = stars.shape[1:]
+    adjacent = np.zeros(stars.shape[0], dtype=bool)
+    for d_row, d_col in NEIGHBOUR_OFFSETS:
+        rows = slice(0, height - d_row)
+        cols = slice(max(-d_col, 0), width - max(d_col, 0))
+        shifted_rows = slice(d_row, height)
+        shifted_cols = slice(max(d_col, 0), width + min(d_col, 0))
+        both = stars[:, rows, cols] & stars[:, shifted_rows, shifted_cols]
+        adjacent |= both.any(axis=(1, 2))
+    return adjacent
+
+
+def check_batch(regions: np.ndarray, stars: np.ndarray, star_count=2, partial: bool = False):
+    """
+    Checks every rule of the puzzle for a batch of candidates
+
+    :param regions: (N, H, W) array of block ids, as given by stack_regions
+    :param stars: (N, H, W) boolean array of stars, as given by stack_stars
+    :param star_count: number of stars per row, column and block, either a
+                       single number or one per puzzle
+    :param partial: if True the candidates are partial placements, which only
+                    need to have no more than star_count stars anywhere
+    :return: dict of (N,) boolean arrays, True where a rule holds: 'rows',
+             'columns', 'blocks', 'adjacency' and 'valid' for all of them
+    """
+    regions = np.asarray(regions)
+    stars = np.asarray(stars, dtype=bool)
+    if regions.shape != stars.shape or regions.ndim != 3:
+        raise ValueError('Expected two (N, H, W) arrays, got shapes {} and {}'
+                         .format(regions.shape, stars.shape))
+    star_count = np.broadcast_to(np.asarray(star_count), (stars.shape[0],)).reshape(-1, 1)
+
+    compare = np.less_equal if partial else np.equal
+    result = {'rows': compare(stars.sum(axis=2), star_count).all(axis=1),
+              'columns': compare(stars.sum(axis=1), star_count).all(axis=1),
+              'blocks': compare(block_counts(regions, stars), star_count).all(axis=1),
+              'adjacency': ~adjacent_stars(stars)}
+    result['valid'] = result['rows'] & result['columns'] & result['blocks'] & result['adjacency']
+    return result
+
+
+def verify_batch(regions: np.ndarray, stars: np.ndarray, star_count=2):
+    """
+    :return: (N,) boolean array, True for the candidates that are solutions
+    """
+    return check_batch(regions, stars, star_count)['valid']
+
+
+def load_batch(path: str):
+    """
+    Loads the puzzles of a corpus and their stored solutions as arrays,
+    grouped by grid size
+
+    :param path: path of a JSON corpus (.json) or a binary corpus (.spc)
+    :return: dict mapping each grid size to (puzzle names, regions, stars,
+             star counts)
+    """
+    groups = {}
+    if path.endswith('.spc'):
+        with CorpusReader(path) as reader:
+            for puzzle in reader:
+                solution = np.unpackbits(np.frombuffer(puzzle.solution, dtype=np.uint8),
+                                         bitorder='little')[:puzzle.grid_size**2]
+                group = groups.setdefault(puzzle.grid_size, ([], [], [], []))
+                group[0].append(puzzle.puzzle_id or '{}[{}]'.format(path, puzzle.index))
+                group[1].append(np.frombuffer(puzzle.regions, dtype=np.uint8))
+                group[2].append(solution.astype(bool))
+                group[3].append(puzzle.stars)
+    else:
+        for i, entry in enumerate(load_json_corpus(path)):
+            data = entry['puzzle_data']
+            group = groups.setdefault(data['width'], ([], [], [], []))
+            group[0].append(entry.get('puzzle_id', '{}[{}]'.format(path, i)))
+            group[1].append(np.frombuffer(data['puzz'].encode(), dtype=np.uint8) - ord('A'))
+            if data.get('solved'):
+                group[2].append(np.frombuffer(data['solved'].encode(), dtype=np.uint8)
+                                == ord('1'))
+            else:
+                # unsolved entries get no stars, as in a binary corpus
+                group[2].append(np.zeros(data['width']**2, dtype=bool))
+            group[3].append(data.get('stars', 2))
+
+    return {grid_size: (names,
+                        np.stack(regions).astype(np.int32).reshape(-1, grid_size, grid_size),
+                        np.stack(stars).reshape(-1, grid_size, grid_size),
+                        np.array(star_counts))
+            for grid_size, (names, regions, stars, star_counts) in groups.items()}
+
+
+def fuzz(algorithms: list, num_puzzles: int, grid_size: int, star_count: int = 2,
+         heuristic: int = 1, seed: int = 0):
+    """
+    Solves random puzzles with several solvers and verifies all of their
+    answers in one batch per solver
+
+    :param algorithms: solvers to compare, as keys of solve.SOLVERS
+    :param num_puzzles: number of puzzles to generate
+    :param grid_size: Size of the grids (10x10 grid -> 10)
+    :param star_count: number of stars per row, column and block
+    :param heuristic: heuristic used by bt and fc
+    :param seed: seed of the puzzle generator
+    :return: dict mapping every solver to the indices of the puzzles it got
+             wrong, by returning an invalid solution or none at all
+    """
+    # imported here since solve imports every solver
+    from puzzle_generator import generate_puzzle
+    from solve import solve_puzzle
+
+    puzzles = [generate_puzzle(grid_size, star_count, seed + i)[0] for i in range(num_puzzles)]
+    regions = stack_regions(puzzles, grid_size)
+    failures = {}
+    for algorithm in algorithms:
+        star_locs = [list(solve_puzzle(blocks, grid_size, algorithm, heuristic,
+                                       star_count)[0].values())
+                     for blocks in puzzles]
+        # every generated puzzle has a solution, so no solution is a failure too
+        valid = verify_batch(regions, stack_stars(star_locs, grid_size), star_count)
+        failures[algorithm] = np.flatnonzero(~valid).tolist()
+    return failures
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description='Verify solutions of star puzzles in batches.')
+    parser.add_argument('corpus', nargs='?', default=None,
+                        help='JSON corpus (.json) or binary corpus (.spc) to verify')
+    parser.add_argument('-r', '--results', default=None,
+                        help='JSON output of solve.py to verify against the corpus, '
+                             'instead of the solutions stored in it')
+    parser.add_argument('--fuzz', type=int, default=0, metavar='N',
+                        help='solve N generated puzzles with every algorithm and verify them')
+    parser.add_argument('-a', '--algorithms', default='bt,fc,ls,dp',
+                        help='comma separated algorithms to fuzz')
+    parser.add_argument('-n', '--size', type=int, default=10,
+                        help='grid size of the fuzzed puzzles')
+    parser.add_argument('-k', '--stars', type=int, default=2,
+                        help='number of stars per row, column and block of the fuzzed puzzles')
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help='seed of the puzzle generator')
+    args = parser.parse_args(argv)
+
+    if args.fuzz:
+        failures = fuzz(args.algorithms.split(','), args.fuzz, args.size, args.stars,
+                        seed=args.seed)
+        for algorithm, failed in failures.items():
+            print('{}: {} of {} puzzles wrong {}'.format(algorithm, len(failed), args.fuzz,
+                                                        failed if failed else ''))
+        return
+
+    if args.corpus is None:
+        parser.error('a corpus is needed unless --fuzz is given')
+    batches = load_batch(args.corpus)
+    results = None
+    if args.results:
+        with open(args.results, 'r') as file:
+            results = {result['name']: result['stars'] for result in json.load(file)}
+
+    for grid_size, (names, regions, stars, star_counts) in sorted(batches.items()):
+        if results is not None:
+            stars = stack_stars([results.get(name, []) for name in names], grid_size)
+        checks = check_batch(regions, stars, star_counts)
+        print('{}x{}: {} of {} solutions valid'.format(grid_size, grid_size,
+                                                       int(checks['valid'].sum()), len(names)))
+        for i in np.flatnonzero(~checks['valid']):
+            broken = [rule for rule in ('rows', 'columns', 'blocks', 'adjacency')
+                      if not checks[rule][i]]
+            print('    {}: {}'.format(names[i], ', '.join(broken)))
+
+
+if __name__ == '__main__':
+    main()
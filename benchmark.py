@@ -0,0 +1,229 @@
+"""
+    File name: benchmark.py
+    Author: Arsh Khokhar, Kiernan Wiese
+    Date last modified: 19 October, 2026
+    Python Version: 3.8
+
+    This script contains a benchmark harness that runs every combination of
+    algorithm and heuristic on a set of puzzle files and prints the checked
+    nodes and run times as a table, in the format used in investigation.txt.
+    It also measures how long the modules of the solver take to import in
+    a fresh interpreter. In scaling mode every engine is run on generated
+    k-star puzzles of growing size instead, each in its own process with a
+    timeout, showing how the nodes, run time and memory grow with k and N.
+"""
+
+import argparse
+import contextlib
+import multiprocessing
+import os
+import subprocess
+import sys
+
+from profiling import SAMPLE_EVERY, Profiler
+from puzzle_generator import generate_puzzle
+from solve import load_puzzles, solve_puzzle
+from tables import format_table
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+ALGORITHM_NAMES = {'bt': 'Backtrack', 'fc': 'Forward checking', 'ls': 'Local search',
+                   'dp': 'Frontier DP'}
+IMPORTED_MODULES = ['CSP', 'solve', 'numpy', 'grid_display']
+SCALING_ENGINES = [('bt', 1), ('fc', 1), ('ls', 1), ('dp', 1)]
+
+
+def measure_import_time(module: str):
+    """
+    Measures the time taken to import a module in a fresh interpreter
+
+    :param module: name of the module to import
+    :return: import time in seconds, None if the module couldn't be imported
+    """
+    code = ('import time\n'
+            'start = time.perf_counter()\n'
+            'import {}\n'
+            'print(time.perf_counter() - start)'.format(module))
+    process = subprocess.run([sys.executable, '-c', code],
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                             cwd=os.path.dirname(os.path.abspath(__file__)),
+                             universal_newlines=True)
+    if process.returncode != 0:
+        return None
+    return float(process.stdout)
+
+
+def run_benchmark(puzzles: list, algorithms: list, heuristics: list, profiler: Profiler = None):
+    """
+    Solves every puzzle with every combination of algorithm and heuristic
+
+    :param puzzles: list of (name, blocks, grid size, stars) tuples
+    :param algorithms: algorithms to run ('bt' and/or 'fc')
+    :param heuristics: heuristics to run
+    :param profiler: if given, the runs are profiled with it, one label per
+                     combination
+    :return: table rows, one per combination, with nodes and run time per puzzle
+    """
+    rows = []
+    for algorithm in algorithms:
+        for heuristic in heuristics:
+            row = ['{} heuristic {}'.format(ALGORITHM_NAMES[algorithm], heuristic)]
+            for _, blocks, grid_size, stars in puzzles:
+                if profiler:
+                    assignment, checked_nodes, run_time = profiler.run(
+                        row[0], solve_puzzle, blocks, grid_size, algorithm, heuristic, stars)
+                else:
+                    assignment, checked_nodes, run_time = solve_puzzle(
+                        blocks, grid_size, algorithm, heuristic, stars)
+                if assignment:
+                    row.extend([checked_nodes, '{:.4g} sec'.format(run_time)])
+                else:
+                    row.extend(['no solution', '{:.4g} sec'.format(run_time)])
+            rows.append(row)
+    return rows
+
+
+def _scaling_job(connection, blocks: list, grid_size: int, stars: int,
+                 algorithm: str, heuristic: int):
+    """
+    Solves a puzzle in a child process and sends back the result with the
+    growth of the peak memory use in kilobytes (None without resource), or
+    the error the solver raised as a string
+    """
+    start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            assignment, checked_nodes, run_time = solve_puzzle(
+                blocks, grid_size, algorithm, heuristic, stars)
+    except Exception as error:
+        connection.send('{}: {}'.format(type(error).__name__, error))
+        connection.close()
+        return
+    memory = None
+    if resource:
+        memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - start_rss
+    connection.send((bool(assignment), checked_nodes, run_time, memory))
+    connection.close()
+
+
+def run_scaling(grid_sizes: list, star_counts: list, timeout: float, seed: int = 0):
+    """
+    Runs every scaling engine on a generated puzzle for every combination of
+    star count and grid size, giving up on an engine after a timeout
+
+    :param grid_sizes: sizes of the generated grids
+    :param star_counts: numbers of stars per row, column and block
+    :param timeout: seconds after which a run is stopped
+    :param seed: seed of the puzzle generator
+    :return: table rows, one per star count, grid size and engine
+    """
+    rows = []
+    for stars in star_counts:
+        for grid_size in grid_sizes:
+            try:
+                blocks, _ = generate_puzzle(grid_size, stars, seed + 1000*stars + grid_size)
+            except ValueError:
+                rows.append([stars, grid_size, 'all', 'no puzzle', '-', '-'])
+                continue
+            for algorithm, heuristic in SCALING_ENGINES:
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(
+                    target=_scaling_job,
+                    args=(sender, blocks, grid_size, stars, algorithm, heuristic))
+                process.start()
+                sender.close()
+                name = ALGORITHM_NAMES[algorithm]
+                if algorithm in ('bt', 'fc'):
+                    name += ' heuristic {}'.format(heuristic)
+                if receiver.poll(timeout):
+                    try:
+                        result = receiver.recv()
+                    except EOFError:
+                        # the child died without sending anything back
+                        process.join()
+                        result = 'exited with code {}'.format(process.exitcode)
+                    if isinstance(result, str):
+                        print('{} on {}x{} {}-star: {}'.format(name, grid_size, grid_size,
+                                                               stars, result), file=sys.stderr)
+                        rows.append([stars, grid_size, name, 'error', '-', '-'])
+                    else:
+                        solved, checked_nodes, run_time, memory = result
+                        rows.append([stars, grid_size, name,
+                                     checked_nodes if solved else 'no solution',
+                                     '{:.4g} sec'.format(run_time),
+                                     '-' if memory is None else '{} KB'.format(memory)])
+                else:
+                    process.terminate()
+                    rows.append([stars, grid_size, name, 'timeout',
+                                 '> {:.4g} sec'.format(timeout), '-'])
+                process.join()
+                receiver.close()
+    return rows
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description='Benchmark the 2-star puzzle solvers.')
+    parser.add_argument('files', nargs='*',
+                        default=['grid8x8.txt', 'grid10x10.txt', 'grid14x14.txt'],
+                        help='grid files, JSON corpora (.json) or binary corpora (.spc)')
+    parser.add_argument('-a', '--algorithms', default='bt,fc',
+                        help='comma separated algorithms to run')
+    parser.add_argument('-H', '--heuristics', default='1,3',
+                        help='comma separated heuristics to run')
+    parser.add_argument('-i', '--index', default=None,
+                        help='puzzles to run from a corpus, e.g. 3 or 0:10')
+    parser.add_argument('-p', '--profile', action='store_true',
+                        help='time the hot paths of the csp and print a table per combination')
+    parser.add_argument('--profile-out', default=None, metavar='FILE',
+                        help='also write the profile as collapsed stacks for flamegraph tools')
+    parser.add_argument('--sample-every', type=int, default=SAMPLE_EVERY, metavar='N',
+                        help='time one call in every N calls when profiling')
+    parser.add_argument('--scaling', action='store_true',
+                        help='run every engine on generated puzzles of growing size instead')
+    parser.add_argument('-k', '--stars', default='1,2,3',
+                        help='comma separated star counts of the scaling benchmark')
+    parser.add_argument('-n', '--sizes', default='8,10,14,17,20,25',
+                        help='comma separated grid sizes of the scaling benchmark')
+    parser.add_argument('-t', '--timeout', type=float, default=60,
+                        help='seconds after which a run of the scaling benchmark is stopped')
+    args = parser.parse_args(argv)
+
+    if args.scaling:
+        rows = run_scaling([int(size) for size in args.sizes.split(',')],
+                           [int(stars) for stars in args.stars.split(',')], args.timeout)
+        print(format_table(['Stars', 'Grid size', 'Engine', 'Nodes', 'Run time',
+                            'Memory growth'], rows))
+        return
+
+    import_rows = []
+    for module in IMPORTED_MODULES:
+        import_time = measure_import_time(module)
+        import_rows.append([module, 'failed' if import_time is None
+                            else '{:.4g} sec'.format(import_time)])
+    print('Import times')
+    print(format_table(['Module', 'Import time'], import_rows))
+
+    puzzles = []
+    for path in args.files:
+        puzzles.extend(load_puzzles(path, index=args.index))
+
+    header = ['Algorithm+Heuristic']
+    for name, _, _, _ in puzzles:
+        header.extend(['{} nodes'.format(name), '{} run time'.format(name)])
+    profiler = Profiler(args.sample_every) if args.profile or args.profile_out else None
+    rows = run_benchmark(puzzles, args.algorithms.split(','),
+                         [int(heuristic) for heuristic in args.heuristics.split(',')], profiler)
+    print('\nSolvers')
+    print(format_table(header, rows))
+    if profiler:
+        print('\nProfile (one call in {} timed)'.format(profiler.sample_every))
+        print(profiler.format_summary())
+        if args.profile_out:
+            profiler.write_collapsed(args.profile_out)
+
+
+if __name__ == '__main__':
+    main()
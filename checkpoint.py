@@ -0,0 +1,171 @@
+"""
+    File name: checkpoint.py
+    Author: Arsh Khokhar, Kiernan Wiese
+    Date last modified: 19 October, 2026
+    Python Version: 3.8
+
+    This script contains the checkpoint files of the backtracking and
+    forward checking searches, which let a long search be split into time
+    limited slices. A checkpoint holds the puzzle, the search path (the
+    variable of every level, its values in the order they are tried and
+    the index of the value being searched, plus the domains each level has
+    to restore when forward checking), the state of the csp and the stats
+    of the search so far. It is pickled and compressed, and replaced
+    atomically so a slice killed while writing leaves the last one intact.
+
+    The checkpoints of a search going on are handled by a Checkpoints
+    object, which the solver creates when the search starts.
+"""
+
+import os
+import pickle
+import time
+import zlib
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_INTERVAL = 60  # seconds
+
+
+def save_checkpoint(path: str, checkpoint: dict):
+    """
+    Writes a checkpoint, replacing the previous one
+
+    :param path: path of the checkpoint file
+    :param checkpoint: dict given by make_checkpoint
+    """
+    data = zlib.compress(pickle.dumps(checkpoint, pickle.HIGHEST_PROTOCOL))
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as file:
+        file.write(data)
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(path: str):
+    """
+    Reads a checkpoint
+
+    :param path: path of the checkpoint file
+    :return: dict given by make_checkpoint
+    """
+    with open(path, 'rb') as file:
+        checkpoint = pickle.loads(zlib.decompress(file.read()))
+    if checkpoint.get('version') != CHECKPOINT_VERSION:
+        raise ValueError('{} is not a version {} checkpoint'.format(path, CHECKPOINT_VERSION))
+    return checkpoint
+
+
+def make_checkpoint(algorithm: str, csp, search_path: list, assignment: dict,
+                    checked_nodes: int, elapsed: float, result=None):
+    """
+    Collects the state of a search
+
+    :param algorithm: 'bt' or 'fc'
+    :param csp: csp of the search
+    :param search_path: [variable, values, index, changed domains] of every
+                        level, the last level having finished values[index]
+    :param assignment: current assignment of the csp
+    :param checked_nodes: number of nodes checked so far
+    :param elapsed: search time so far in seconds, over all slices
+    :param result: None while the search is going on, otherwise the tuple
+                   (assignment or None,) it ended with
+    :return: dict holding the checkpoint
+    """
+    frames = [[var, values, index, changed_domains]
+              for var, values, index, changed_domains in search_path]
+    if frames:
+        frames[-1][2] += 1  # the last level carries on with its next value
+    return {'version': CHECKPOINT_VERSION,
+            'algorithm': algorithm,
+            'heuristic': csp.ordering_choice,
+            'puzzle': csp.puzzle,
+            'state': csp.get_state(),
+            'frames': frames,
+            'assignment': dict(assignment),
+            'checked_nodes': checked_nodes,
+            'elapsed': elapsed,
+            'result': result}
+
+
+class Checkpoints:
+    """
+    Checkpoints of a backtracking or forward checking search
+
+    Attributes
+        algorithm       'bt' or 'fc'
+        path            checkpoint file, None for a search without checkpoints
+        interval        seconds between checkpoints
+        next_time       time at which the next checkpoint is due
+        elapsed_before  search time of the slices before this one
+        search_path     [variable, values, index of the value being searched,
+                            domains changed by assigning it (fc only)] of every
+                            level, kept up to date by the recursive search
+    """
+    __slots__ = ('algorithm', 'path', 'interval', 'next_time', 'elapsed_before', 'search_path')
+
+    def __init__(self, algorithm: str, path: str = None, interval: float = CHECKPOINT_INTERVAL,
+                 elapsed_before: float = 0):
+        """
+        Sets up the checkpoints of a search that starts now
+
+        :param algorithm: 'bt' or 'fc'
+        :param path: file to write checkpoints to, None for no checkpoints
+        :param interval: seconds between checkpoints
+        :param elapsed_before: search time of the earlier slices of the search
+        """
+        self.algorithm = algorithm
+        self.path = path
+        self.interval = interval
+        self.next_time = time.time() + interval
+        self.elapsed_before = elapsed_before
+        self.search_path = []
+
+    def write(self, csp, assignment: dict, checked_nodes: int, result: tuple = None):
+        """
+        Writes the current state of the search to the checkpoint file
+
+        :param csp: csp of the search
+        :param assignment: current assignment of the csp
+        :param checked_nodes: number of nodes checked so far, over all slices
+        :param result: None while searching, (solution or None,) once the search ended
+        """
+        now = time.time()
+        save_checkpoint(self.path, make_checkpoint(
+            self.algorithm, csp, self.search_path if result is None else [], assignment,
+            checked_nodes, self.elapsed_before + now - csp.start_time, result))
+        self.next_time = now + self.interval
+
+    def finish(self, result, csp, checked_nodes: int):
+        """
+        Records the end of the search in the checkpoint file, unless it timed out
+
+        :param result: result of the recursive search
+        :param csp: csp of the search
+        :param checked_nodes: number of nodes checked, over all slices
+        :return: the result
+        """
+        if self.path is not None:
+            if result is None or result[0] is not None:
+                self.write(csp, {}, checked_nodes, (result[0] if result else None,))
+            self.path = None
+        return result
+
+
+def resume(path: str, time_limit: float = None, checkpoint_interval: float = CHECKPOINT_INTERVAL):
+    """
+    Resumes the search saved in a checkpoint with the solver that wrote it
+
+    :param path: path of the checkpoint file, which keeps being updated
+    :param time_limit: number of seconds this slice may run, defaults to
+                       the time limit of the solver
+    :param checkpoint_interval: seconds between checkpoints
+    :return: the result of the solver, as for backtrack and forward_check
+    """
+    # imported here since the solvers import this module
+    from backtrack import resume_backtrack
+    from forward_checking import resume_forward_check
+
+    algorithm = load_checkpoint(path)['algorithm']
+    solver = {'bt': resume_backtrack, 'fc': resume_forward_check}[algorithm]
+    if time_limit is None:
+        return solver(path, checkpoint_interval=checkpoint_interval)
+    return solver(path, time_limit, checkpoint_interval)
@@ -0,0 +1,498 @@
+"""
+    File name: distributed.py
+    Author: Arsh Khokhar, Kiernan Wiese
+    Date last modified: 19 October, 2026
+    Python Version: 3.8
+
+    This script contains a coordinator and workers for solving a whole
+    corpus (a JSON corpus in the Examples format) on several machines. The
+    coordinator splits the corpus into chunks and hands them to the workers
+    that connect to it over TCP. Workers solve their chunk with backtracking
+    or forward checking and send heartbeats while doing so; the chunks of a
+    worker that disconnects or stops sending heartbeats go back to the queue
+    for the other workers. The results are merged in corpus order with their
+    checked nodes and run times, and compared with the stored solutions.
+
+    Every message is a single line of JSON with a "type":
+        worker -> coordinator
+            request     {"worker": name}, asks for a chunk
+            heartbeat   {"chunk": id}, sent while solving a chunk
+            result      {"chunk": id, "results": [...]}, one result per puzzle
+        coordinator -> worker, in reply to a request
+            chunk       {"chunk": id, "algorithm", "heuristic", "time_limit",
+                        "puzzles": [{"index", "puzzle_id", "puzzle_data":
+                        {"puzz", "width", "stars"}}, ...]}, the puzzles
+                        being entries of the corpus without their solutions
+            wait        {"seconds": s}, every chunk is taken but may come back
+            done        every chunk is solved, the worker can exit
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+
+from collections import deque
+
+from backtrack import TIME_LIMIT
+from puzzle_corpus import entry_blocks, load_json_corpus
+from tables import format_table
+
+DEFAULT_PORT = 5455
+CHUNK_SIZE = 4
+HEARTBEAT_INTERVAL = 2  # seconds
+HEARTBEAT_TIMEOUT = 10  # seconds without a message after which a worker is dead
+WAIT_INTERVAL = 1  # seconds
+
+
+def send_message(connection, message: dict, lock: threading.Lock = None):
+    """
+    Sends a message as a line of JSON
+
+    :param connection: connected socket
+    :param message: message to be sent
+    :param lock: lock held while sending, for sockets shared between threads
+    """
+    data = (json.dumps(message, separators=(',', ':')) + '\n').encode()
+    if lock is None:
+        connection.sendall(data)
+    else:
+        with lock:
+            connection.sendall(data)
+
+
+class Coordinator:
+    """
+    Hands out the chunks of a corpus to workers and collects their results
+
+    Attributes
+        entries             entries of the corpus
+        chunks              list of chunks, each a list of puzzle messages
+        settings            algorithm, heuristic and time limit sent with chunks
+        heartbeat_timeout   seconds without a message after which a worker
+                                is considered dead
+        pending             ids of the chunks waiting for a worker
+        assigned            dict mapping the chunks being solved to their worker
+        finished            ids of the chunks solved
+        results             dict mapping puzzle indices to their results
+        workers             dict mapping worker names to their connection,
+                                the time of their last message and stats
+        condition           lock of all of the above, notified when a chunk
+                                is finished
+        server              TCP server the workers connect to
+        thread              thread serving the workers, None until started
+    """
+    def __init__(self, entries: list, algorithm: str = 'fc', heuristic: int = 1,
+                 time_limit: float = TIME_LIMIT, chunk_size: int = CHUNK_SIZE,
+                 host: str = '', port: int = DEFAULT_PORT,
+                 heartbeat_timeout: float = HEARTBEAT_TIMEOUT):
+        """
+        Constructor for a coordinator, which starts listening right away
+
+        :param entries: entries of a corpus in the Examples format
+        :param algorithm: 'bt' or 'fc'
+        :param heuristic: heuristic used by the workers
+        :param time_limit: seconds after which a worker gives up on a puzzle
+        :param chunk_size: number of puzzles handed out at a time
+        :param host: address to listen on, all interfaces by default
+        :param port: port to listen on, 0 for any free port
+        :param heartbeat_timeout: seconds without a message after which a
+                                  worker is considered dead
+        """
+        self.entries = entries
+        puzzles = []
+        for i, entry in enumerate(entries):
+            data = entry['puzzle_data']
+            puzzles.append({'index': i,
+                            'puzzle_id': entry.get('puzzle_id', data.get('ptitle', str(i))),
+                            'puzzle_data': {'puzz': data['puzz'], 'width': data['width'],
+                                            'stars': data.get('stars', 2)}})
+        self.chunks = [puzzles[i:i + chunk_size] for i in range(0, len(puzzles), chunk_size)]
+        self.settings = {'algorithm': algorithm, 'heuristic': heuristic,
+                         'time_limit': time_limit}
+        self.heartbeat_timeout = heartbeat_timeout
+        self.pending = deque(range(len(self.chunks)))
+        self.assigned = {}
+        self.finished = set()
+        self.results = {}
+        self.workers = {}
+        self.condition = threading.Condition()
+
+        coordinator = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                coordinator.handle_connection(self.connection, self.rfile)
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self.server = socketserver.ThreadingTCPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def port(self):
+        return self.server.server_address[1]
+
+    def is_finished(self):
+        return not self.pending and not self.assigned
+
+    def handle_connection(self, connection, reader):
+        """
+        Serves the messages of a single worker until it disconnects
+        """
+        worker = None
+        try:
+            for line in reader:
+                message = json.loads(line)
+                if worker is None:
+                    worker = message.get('worker') or '{}:{}'.format(*connection.getpeername()[:2])
+                    with self.condition:
+                        self.workers[worker] = {'connection': connection, 'last_seen': time.time(),
+                                                'chunks': 0, 'puzzles': 0, 'checked_nodes': 0,
+                                                'run_time': 0.0, 'reassigned': 0,
+                                                'alive': True}
+                reply = self.handle_message(worker, message)
+                if reply is not None:
+                    send_message(connection, reply)
+        except (OSError, ValueError):
+            pass  # the worker died or was dropped, its chunks are handed out again
+        finally:
+            if worker is not None:
+                self.drop_worker(worker)
+
+    def handle_message(self, worker: str, message: dict):
+        """
+        Handles a message of a worker
+
+        :param worker: name of the worker
+        :param message: message sent by the worker
+        :return: reply to the worker, None if there's none
+        """
+        with self.condition:
+            stats = self.workers[worker]
+            stats['last_seen'] = time.time()
+            kind = message['type']
+            if kind == 'request':
+                if self.pending:
+                    chunk = self.pending.popleft()
+                    self.assigned[chunk] = worker
+                    return dict(self.settings, type='chunk', chunk=chunk,
+                                puzzles=self.chunks[chunk])
+                if self.assigned:
+                    # the worker sends no heartbeats while waiting
+                    return {'type': 'wait',
+                            'seconds': min(WAIT_INTERVAL, self.heartbeat_timeout / 3)}
+                return {'type': 'done'}
+            if kind == 'result':
+                chunk = message['chunk']
+                # a chunk handed out again may be finished twice, the first result is kept
+                if chunk not in self.finished:
+                    self.finished.add(chunk)
+                    if chunk in self.pending:
+                        self.pending.remove(chunk)
+                    self.assigned.pop(chunk, None)
+                    for result in message['results']:
+                        self.results[result['index']] = dict(result, worker=worker)
+                        stats['checked_nodes'] += result['checked_nodes']
+                        stats['run_time'] += result['run_time']
+                    stats['chunks'] += 1
+                    stats['puzzles'] += len(message['results'])
+                    self.condition.notify_all()
+            return None
+
+    def drop_worker(self, worker: str):
+        """
+        Hands the chunks of a worker out again and closes its connection
+        """
+        with self.condition:
+            stats = self.workers.get(worker)
+            if stats is None or not stats['alive']:
+                return
+            stats['alive'] = False
+            for chunk, owner in list(self.assigned.items()):
+                if owner == worker:
+                    del self.assigned[chunk]
+                    self.pending.appendleft(chunk)
+                    stats['reassigned'] += 1
+            self.condition.notify_all()
+        try:
+            stats['connection'].shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def check_heartbeats(self):
+        """
+        Drops the workers that haven't sent a message for heartbeat_timeout seconds
+        """
+        now = time.time()
+        with self.condition:
+            dead = [worker for worker, stats in self.workers.items()
+                    if stats['alive'] and now - stats['last_seen'] > self.heartbeat_timeout]
+        for worker in dead:
+            print('Worker {} stopped responding, handing its chunks out again'.format(worker),
+                  file=sys.stderr)
+            self.drop_worker(worker)
+
+    def start(self):
+        """
+        Starts serving workers in the background, if not serving already
+        """
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+            self.thread.start()
+
+    def run(self, timeout: float = None):
+        """
+        Serves workers until every chunk is solved
+
+        :param timeout: seconds after which to give up, None to wait forever
+        :return: list of results in corpus order, see merged_results
+        """
+        self.start()
+        deadline = None if timeout is None else time.time() + timeout
+        try:
+            while True:
+                with self.condition:
+                    if self.is_finished() or (deadline is not None and time.time() >= deadline):
+                        break
+                    self.condition.wait(min(1.0, self.heartbeat_timeout / 2))
+                self.check_heartbeats()
+            # workers asking for more work in the meantime are told to exit
+            time.sleep(WAIT_INTERVAL if self.workers else 0)
+        finally:
+            self.server.shutdown()
+            self.server.server_close()
+        return self.merged_results()
+
+    def merged_results(self):
+        """
+        :return: one dict per puzzle in corpus order, with the solution found,
+                 checked nodes, run time, worker and whether the solution
+                 matches the one stored in the corpus (None if there's none)
+        """
+        merged = []
+        for i, entry in enumerate(self.entries):
+            result = self.results.get(i)
+            if result is None:
+                merged.append({'index': i, 'puzzle_id': entry.get('puzzle_id'),
+                               'solved': False, 'stars': [], 'checked_nodes': 0,
+                               'run_time': 0.0, 'worker': None, 'matches_corpus': False})
+                continue
+            result = dict(result)
+            stored = entry['puzzle_data'].get('solved')
+            if stored:
+                solution = [cell + 1 for cell, char in enumerate(stored) if char == '1']
+                result['matches_corpus'] = result['stars'] == solution
+            else:
+                result['matches_corpus'] = None
+            merged.append(result)
+        return merged
+
+    def worker_rows(self):
+        """
+        :return: table rows with the chunks, puzzles, checked nodes, solving
+                 time and chunks handed out again of every worker
+        """
+        with self.condition:
+            return [[worker, stats['chunks'], stats['puzzles'], stats['checked_nodes'],
+                     '{:.4g} sec'.format(stats['run_time']), stats['reassigned']]
+                    for worker, stats in sorted(self.workers.items())]
+
+
+def connect(host: str, port: int, timeout: float):
+    """
+    Connects to a coordinator, retrying until it is up or the timeout passes
+
+    :return: connected socket
+    """
+    deadline = time.time() + timeout
+    while True:
+        try:
+            return socket.create_connection((host, port))
+        except OSError:
+            if time.time() >= deadline:
+                raise
+            time.sleep(0.2)
+
+
+def solve_chunk(message: dict):
+    """
+    Solves the puzzles of a chunk
+
+    :param message: chunk message of the coordinator
+    :return: list of results, one per puzzle
+    """
+    # imported here since solve imports every solver
+    from solve import solve_puzzle
+
+    results = []
+    for puzzle in message['puzzles']:
+        blocks, grid_size, stars = entry_blocks(puzzle)
+        assignment, checked_nodes, run_time = solve_puzzle(
+            blocks, grid_size, message['algorithm'], message['heuristic'], stars,
+            time_limit=message['time_limit'])
+        results.append({'index': puzzle['index'],
+                        'puzzle_id': puzzle['puzzle_id'],
+                        'solved': bool(assignment),
+                        'stars': sorted(assignment.values()),
+                        'checked_nodes': checked_nodes,
+                        'run_time': run_time})
+    return results
+
+
+def work(host: str = 'localhost', port: int = DEFAULT_PORT, name: str = None,
+         heartbeat_interval: float = HEARTBEAT_INTERVAL, connect_timeout: float = 30):
+    """
+    Solves chunks handed out by a coordinator until it has none left
+
+    :param host: address of the coordinator
+    :param port: port of the coordinator
+    :param name: name of the worker, host name and process id by default
+    :param heartbeat_interval: seconds between heartbeats while solving
+    :param connect_timeout: seconds to keep trying to reach the coordinator
+    :return: number of puzzles solved by this worker
+    """
+    name = name or '{}:{}'.format(socket.gethostname(), os.getpid())
+    connection = connect(host, port, connect_timeout)
+    reader = connection.makefile('r')
+    lock = threading.Lock()
+    solved = 0
+    try:
+        send_message(connection, {'type': 'request', 'worker': name}, lock)
+        for line in reader:
+            message = json.loads(line)
+            if message['type'] == 'done':
+                break
+            if message['type'] == 'wait':
+                time.sleep(message['seconds'])
+            else:
+                stop = threading.Event()
+
+                def heartbeat(chunk=message['chunk']):
+                    while not stop.wait(heartbeat_interval):
+                        send_message(connection, {'type': 'heartbeat', 'chunk': chunk}, lock)
+
+                thread = threading.Thread(target=heartbeat, daemon=True)
+                thread.start()
+                try:
+                    results = solve_chunk(message)
+                finally:
+                    stop.set()
+                    thread.join()
+                send_message(connection, {'type': 'result', 'chunk': message['chunk'],
+                                          'results': results}, lock)
+                solved += len(results)
+            send_message(connection, {'type': 'request', 'worker': name}, lock)
+    except OSError:
+        pass  # the coordinator is gone
+    finally:
+        reader.close()
+        connection.close()
+    return solved
+
+
+def start_local_workers(count: int, port: int, heartbeat_interval: float = HEARTBEAT_INTERVAL):
+    """
+    Starts worker processes on this machine
+
+    :param count: number of workers
+    :param port: port of the coordinator on localhost
+    :param heartbeat_interval: seconds between heartbeats while solving
+    :return: list of the worker processes
+    """
+    script = os.path.abspath(__file__)
+    return [subprocess.Popen([sys.executable, script, 'work', '--host', 'localhost',
+                              '--port', str(port), '--name', 'local-{}'.format(i),
+                              '--heartbeat', str(heartbeat_interval)],
+                             stdout=subprocess.DEVNULL, cwd=os.path.dirname(script))
+            for i in range(count)]
+
+
+def print_report(coordinator: Coordinator, results: list, output: str = None):
+    """
+    Prints the worker stats and a summary of the results, and writes the
+    results as JSON if an output file is given
+    """
+    print(format_table(['Worker', 'Chunks', 'Puzzles', 'Checked nodes', 'Run time', 'Reassigned'],
+                       coordinator.worker_rows()))
+    solved = sum(1 for result in results if result['solved'])
+    mismatched = [result['puzzle_id'] for result in results
+                  if result['solved'] and result['matches_corpus'] is False]
+    print('{} of {} puzzles solved, {} checked nodes, {:.4g} sec of solving'
+          .format(solved, len(results), sum(result['checked_nodes'] for result in results),
+                  sum(result['run_time'] for result in results)))
+    if mismatched:
+        print('Solutions differing from the corpus: {}'.format(', '.join(mismatched)))
+    if output:
+        with open(output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description='Solve a corpus with several workers over TCP.')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    coordinate = commands.add_parser('coordinate', help='hand out a corpus to workers')
+    local = commands.add_parser('local', help='coordinate workers started on this machine')
+    for command in coordinate, local:
+        command.add_argument('corpus', help='JSON corpus in the Examples format')
+        command.add_argument('-a', '--algorithm', choices=('bt', 'fc'), default='fc',
+                             help='bt for backtracking, fc for forward checking')
+        command.add_argument('-H', '--heuristic', type=int, choices=range(4), default=1,
+                             help='heuristic type (0,1,2,or 3)')
+        command.add_argument('-t', '--time-limit', type=float, default=TIME_LIMIT,
+                             help='seconds after which a puzzle is given up')
+        command.add_argument('-c', '--chunk-size', type=int, default=CHUNK_SIZE,
+                             help='number of puzzles handed out at a time')
+        command.add_argument('--heartbeat-timeout', type=float, default=HEARTBEAT_TIMEOUT,
+                             help='seconds without a heartbeat after which a worker is dead')
+        command.add_argument('-o', '--output', default=None,
+                             help='JSON file to write the merged results to')
+    coordinate.add_argument('--host', default='', help='address to listen on')
+    coordinate.add_argument('--port', type=int, default=DEFAULT_PORT, help='port to listen on')
+    local.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 2,
+                       help='number of worker processes')
+
+    worker = commands.add_parser('work', help='solve chunks handed out by a coordinator')
+    worker.add_argument('--host', default='localhost', help='address of the coordinator')
+    worker.add_argument('--port', type=int, default=DEFAULT_PORT, help='port of the coordinator')
+    worker.add_argument('--name', default=None, help='name of the worker')
+    worker.add_argument('--heartbeat', type=float, default=HEARTBEAT_INTERVAL,
+                        help='seconds between heartbeats')
+    args = parser.parse_args(argv)
+
+    if args.command == 'work':
+        print('Solved {} puzzles'.format(work(args.host, args.port, args.name, args.heartbeat)))
+        return
+
+    entries = load_json_corpus(args.corpus)
+    coordinator = Coordinator(entries, args.algorithm, args.heuristic, args.time_limit,
+                              args.chunk_size,
+                              'localhost' if args.command == 'local' else args.host,
+                              0 if args.command == 'local' else args.port,
+                              args.heartbeat_timeout)
+    print('Coordinating {} puzzles in {} chunks on port {}'
+          .format(len(entries), len(coordinator.chunks), coordinator.port), file=sys.stderr)
+    workers = []
+    if args.command == 'local':
+        workers = start_local_workers(args.workers, coordinator.port,
+                                      min(HEARTBEAT_INTERVAL, args.heartbeat_timeout / 3))
+    try:
+        results = coordinator.run()
+    finally:
+        for process in workers:
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+    print_report(coordinator, results, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,229 @@
+"""
+    File name: frontier_dp.py
+    Author: Arsh Khokhar, Kiernan Wiese
+    Date last modified: 19 October, 2026
+    Python Version: 3.8
+
+    This script contains a dynamic programming algorithm that sweeps the
+    grid row by row to count the solutions of a 2-star puzzle exactly and
+    find one of them without backtracking. Going from one row to the next
+    only depends on a small frontier: the stars of the previous row, the
+    number of stars in every column and the number of stars in every block
+    that has cells both above and below the current row. The number of ways
+    to reach every frontier state is memoized, so equal partial solutions
+    are only extended once.
+"""
+
+import argparse
+import time
+
+from itertools import combinations
+from operator import add, sub
+
+from puzzle import Puzzle
+from tables import format_table
+
+
+def frontier_dp(blocks, grid_size: int, stars: int = 2):
+    """
+    Sweeps the grid row by row, keeping the number of partial solutions
+    that lead to each frontier state
+
+    :param blocks: 2-D array containing the blocks, and their contents,
+                   or a Puzzle
+    :param grid_size: Size of the grid (10x10 grid -> 10)
+    :param stars: number of stars per row, column and block, ignored if
+                  blocks is a Puzzle
+    :return count: number of solutions of the puzzle
+    :return solution: sorted list of the cells with stars in one solution,
+                      None if there's no solution
+    :return layer_sizes: number of frontier states after each row
+    :return transitions: number of row placements that were tried
+    """
+    puzzle = blocks if isinstance(blocks, Puzzle) else Puzzle(blocks, grid_size, stars)
+    grid_size, stars = puzzle.grid_size, puzzle.stars
+    region = [puzzle.regions[i*grid_size:(i + 1)*grid_size] for i in range(grid_size)]
+    last_row = [0]*len(puzzle.blocks)
+    for row in range(grid_size):
+        for block in region[row]:
+            last_row[block] = row
+
+    # most stars each block can still get below each row, counting at most
+    # the stars that fit in each row without being next to each other
+    capacity_below = [[0]*len(puzzle.blocks) for _ in range(grid_size)]
+    for row in range(grid_size - 2, -1, -1):
+        capacity_below[row] = capacity_below[row + 1][:]
+        cells = region[row + 1]
+        col = 0
+        while col < grid_size:
+            run = 1
+            while col + run < grid_size and cells[col + run] == cells[col]:
+                run += 1
+            capacity_below[row][cells[col]] += (run + 1) // 2
+            col += run
+        for block in range(len(puzzle.blocks)):
+            capacity_below[row][block] = min(capacity_below[row][block], stars*(grid_size - row - 1))
+
+    # every way to place the stars of a row, with no two stars next to each other
+    masks = [sum(1 << col for col in cols)
+             for cols in combinations(range(grid_size), stars)
+             if all(b - a > 1 for a, b in zip(cols, cols[1:]))]
+    mask_bits = {mask: tuple(mask >> col & 1 for col in range(grid_size)) for mask in masks}
+    # placements allowed below each placement of the previous row
+    allowed_after = {0: masks}
+    for previous in masks:
+        blocked = previous | previous << 1 | previous >> 1
+        allowed_after[previous] = [mask for mask in masks if not mask & blocked]
+
+    # a frontier state is (stars of the previous row, column counts,
+    # counts of the open blocks in the order of open_blocks)
+    open_blocks = ()
+    layer = {(0, (0,)*grid_size, ()): (1, None, 0)}
+    layers = []
+    layer_sizes = []
+    transitions = 0
+
+    for row in range(grid_size):
+        row_blocks = sorted(set(region[row]))
+        touched = sorted(set(open_blocks) | set(row_blocks))
+        next_open = tuple(block for block in touched if last_row[block] > row)
+        closing = [i for i, block in enumerate(touched) if last_row[block] == row]
+        keep = [i for i, block in enumerate(touched) if last_row[block] > row]
+        # fewest stars each open block needs by now to still be filled later
+        keep_min = [stars - capacity_below[row][touched[i]] for i in keep]
+        previous_index = [touched.index(block) for block in open_blocks]
+
+        # stars each placement adds to every touched block, skipping any
+        # placement that overfills a block on its own
+        block_adds = {}
+        for mask in masks:
+            adds = [0]*len(touched)
+            for col in range(grid_size):
+                if mask >> col & 1:
+                    adds[touched.index(region[row][col])] += 1
+            if max(adds) <= stars:
+                block_adds[mask] = adds
+
+        # a column can't get more stars than fit in the rows left, since
+        # stars in one column can't be in neighbouring rows
+        rows_left = grid_size - row - 1
+        min_with_star = stars - rows_left // 2
+        min_without_star = stars - (rows_left + 1) // 2
+        col_min = {mask: tuple(min_with_star if bit else min_without_star
+                               for bit in mask_bits[mask]) for mask in block_adds}
+
+        next_layer = {}
+        for state, (count, _, _) in layer.items():
+            previous_mask, col_counts, block_counts = state
+            base = [0]*len(touched)
+            for i, block_count in zip(previous_index, block_counts):
+                base[i] = block_count
+            for mask in allowed_after[previous_mask]:
+                adds = block_adds.get(mask)
+                if adds is None:
+                    continue
+                transitions += 1
+                counts = list(map(add, base, adds))
+                if any(counts[i] != stars for i in closing) or \
+                        any(not low <= counts[i] <= stars for i, low in zip(keep, keep_min)):
+                    continue
+                new_cols = tuple(map(add, col_counts, mask_bits[mask]))
+                if max(new_cols) > stars or min(map(sub, new_cols, col_min[mask])) < 0:
+                    continue
+                new_state = (mask, new_cols, tuple(counts[i] for i in keep))
+                if new_state in next_layer:
+                    total, parent, parent_mask = next_layer[new_state]
+                    next_layer[new_state] = (total + count, parent, parent_mask)
+                else:
+                    next_layer[new_state] = (count, state, mask)
+
+        layers.append(next_layer)
+        layer_sizes.append(len(next_layer))
+        layer = next_layer
+        open_blocks = next_open
+        if not layer:
+            return 0, None, layer_sizes + [0]*(grid_size - row - 1), transitions
+
+    count = sum(total for total, _, _ in layer.values())
+
+    # follow the parents of any final state back to the first row
+    solution = []
+    state = next(iter(layer))
+    for row in range(grid_size - 1, -1, -1):
+        _, parent, mask = layers[row][state]
+        solution.extend(row*grid_size + col + 1 for col in range(grid_size) if mask >> col & 1)
+        state = parent
+    return count, sorted(solution), layer_sizes, transitions
+
+
+def count_solutions(blocks, grid_size: int, stars: int = 2):
+    """
+    Counts the solutions of a puzzle exactly
+
+    :param blocks: 2-D array containing the blocks, and their contents,
+                   or a Puzzle
+    :param grid_size: Size of the grid (10x10 grid -> 10)
+    :param stars: number of stars per row, column and block
+    :return count: number of solutions of the puzzle
+    :return layer_sizes: number of frontier states after each row
+    """
+    count, _, layer_sizes, _ = frontier_dp(blocks, grid_size, stars)
+    return count, layer_sizes
+
+
+def frontier_solve(blocks, grid_size: int, stars: int = 2):
+    """
+    Solves a puzzle using the row by row dynamic programming algorithm
+
+    :param blocks: 2-D array containing the blocks, and their contents,
+                   or a Puzzle
+    :param grid_size: Size of the grid (10x10 grid -> 10)
+    :param stars: number of stars per row, column and block
+    :return assignment: A valid solution of the 2-star csp, None if there's no solution
+    :return checked_nodes: The number of row placements that were tried
+    """
+    puzzle = blocks if isinstance(blocks, Puzzle) else Puzzle(blocks, grid_size, stars)
+    stars = puzzle.stars
+    _, solution, _, transitions = frontier_dp(puzzle, grid_size)
+    if solution is None:
+        return None, transitions
+
+    # number the stars like the variables of the csp, stars at a time per block
+    assignment = {}
+    filled = [0]*len(puzzle.blocks)
+    for cell in solution:
+        block = puzzle.cell_map[cell].block
+        assignment[stars*block + filled[block]] = cell
+        filled[block] += 1
+    return assignment, transitions
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description='Count the solutions of 2-star puzzles '
+                                                 'and show the size of the frontier tables.')
+    parser.add_argument('files', nargs='+',
+                        help='grid files, JSON corpora (.json) or binary corpora (.spc)')
+    parser.add_argument('-k', '--stars', type=int, default=2,
+                        help='number of stars per row, column and block of grid files')
+    parser.add_argument('-i', '--index', default=None,
+                        help='puzzles to count from a corpus, e.g. 3 or 0:10')
+    args = parser.parse_args(argv)
+
+    # imported here since solve.py imports this module
+    from solve import load_puzzles
+
+    rows = []
+    for path in args.files:
+        for name, blocks, grid_size, stars in load_puzzles(path, index=args.index,
+                                                          stars=args.stars):
+            start_time = time.time()
+            count, _, layer_sizes, transitions = frontier_dp(blocks, grid_size, stars)
+            rows.append([name, count, max(layer_sizes), sum(layer_sizes), transitions,
+                         '{:.4g} sec'.format(time.time() - start_time)])
+            print('{} states per row: {}'.format(name, layer_sizes))
+    print(format_table(['Puzzle', 'Solutions', 'Largest table', 'Total states',
+                        'Transitions', 'Run time'], rows))
+
+
+if __name__ == '__main__':
+    main()
@@ -33,7 +33,7 @@ def display_grid(blocks: list, grid_length: int, star_locs: list = None,
 
     # Create figure and axes
     fig, ax = plt.subplots(figsize=(7, 7))
-    fig.canvas.set_window_title(title)
+    fig.canvas.manager.set_window_title(title)
     ax.set_title(title)
 
     # create grid
@@ -48,6 +48,7 @@ def display_grid(blocks: list, grid_length: int, star_locs: list = None,
     
     ax.axvline(x, lw=2, color='k')
     for blockNum, block in enumerate(blocks):
+        block = set(block)  # constant time lookups for the border checks below
         for cell in block:
             if show_block_ids:
                 plt.text((cell - 1) % grid_length + 0.8,
@@ -11,11 +11,13 @@
 """
 
 
-def load_grid_file(name: str):
+def load_grid_file(name: str, grid_size: int = None):
     """
     Reads grid file and loads data into a 2D array.
 
     :param name: The name of the grid file to be loaded.
+    :param grid_size: Size of the grid, if the name isn't of the format
+                      "gridNxN.txt"
     :return: 2D list of blocks, size of grid
     """
 
@@ -23,11 +25,18 @@ def load_grid_file(name: str):
     with open(name, 'r') as file:
         lines = file.readlines()
         for line in lines:
+            if not line.strip():
+                continue
             cells = line.strip().split('\t')[1].split(',')
             # convert strings to ints
             blocks.append(sorted([int(numeric_string) for numeric_string in cells]))
 
-    # The below retrieval assumes the format "gridNxN.txt".
-    grid_size = name.split('grid')[-1].split('.')[0].split('x')
+    if grid_size is not None:
+        return blocks, grid_size
 
-    return blocks, int(grid_size[0])
+    # The below retrieval assumes the format "gridNxN.txt".
+    try:
+        return blocks, int(name.split('grid')[-1].split('.')[0].split('x')[0])
+    except ValueError:
+        # otherwise the grid is square, so its size follows from the cell count
+        return blocks, int(round(sum(len(block) for block in blocks) ** 0.5))
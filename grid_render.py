@@ -0,0 +1,163 @@
+"""
+    File name: grid_render.py
+    Author: Arsh Khokhar, Kiernan Wiese
+    Date last modified: 19 October, 2026
+    Python Version: 3.8
+
+    This script contains functions to render grids and their solutions to
+    image files (PNG, SVG or anything else matplotlib can write) without
+    opening any windows. All the lines and stars of a grid are drawn as a
+    handful of collections instead of one artist per cell border, and whole
+    streams of results can be rendered in parallel worker processes.
+"""
+
+import os
+import re
+
+from multiprocessing import Pool
+
+import numpy as np
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+
+def region_grid(blocks: list, grid_size: int):
+    """
+    Converts the 2D list of blocks to a grid of block ids
+
+    :param blocks: 2-D array containing the blocks, and their contents.
+    :param grid_size: Size of the grid (10x10 grid -> 10)
+    :return: grid_size x grid_size array holding the block id of every cell
+    """
+    regions = np.zeros(grid_size*grid_size, dtype=np.int32)
+    for i, block in enumerate(blocks):
+        regions[np.asarray(block) - 1] = i
+    return regions.reshape(grid_size, grid_size)
+
+
+def border_segments(regions):
+    """
+    Finds the line segments separating neighbouring cells of different
+    blocks, in axis coordinates (x to the right, y downwards)
+
+    :param regions: grid of block ids, as returned by region_grid
+    :return: array of shape (number of segments, 2, 2)
+    """
+    # vertical borders between cell (row, col) and (row, col + 1)
+    rows, cols = np.nonzero(regions[:, :-1] != regions[:, 1:])
+    vertical = np.stack([np.stack([cols + 1, rows], axis=1),
+                         np.stack([cols + 1, rows + 1], axis=1)], axis=1)
+    # horizontal borders between cell (row, col) and (row + 1, col)
+    rows, cols = np.nonzero(regions[:-1, :] != regions[1:, :])
+    horizontal = np.stack([np.stack([cols, rows + 1], axis=1),
+                           np.stack([cols + 1, rows + 1], axis=1)], axis=1)
+    return np.concatenate([vertical, horizontal]).astype(float)
+
+
+def grid_segments(grid_size: int):
+    """
+    :param grid_size: Size of the grid (10x10 grid -> 10)
+    :return: segments of every row and column line of the grid
+    """
+    lines = np.arange(grid_size + 1)
+    ends = np.full(grid_size + 1, grid_size)
+    starts = np.zeros(grid_size + 1)
+    vertical = np.stack([np.stack([lines, starts], axis=1),
+                         np.stack([lines, ends], axis=1)], axis=1)
+    horizontal = np.stack([np.stack([starts, lines], axis=1),
+                           np.stack([ends, lines], axis=1)], axis=1)
+    return np.concatenate([vertical, horizontal]).astype(float)
+
+
+def render_grid(blocks: list, grid_size: int, star_locs: list, path: str,
+                title: str = None, size: float = 7, dpi: int = 100):
+    """
+    Renders a grid, with thick lines separating blocks and stars where given,
+    to an image file. The format is taken from the extension of the path.
+
+    :param blocks: 2-D array containing the blocks, and their contents.
+    :param grid_size: Size of the grid (10x10 grid -> 10)
+    :param star_locs: Locations of stars.
+    :param path: path of the image file to be written
+    :param title: title shown above the grid, none if not given
+    :param size: width and height of the image in inches
+    :param dpi: resolution of raster images
+    :return: path of the written file
+    """
+    # a figure that isn't managed by pyplot never opens a window
+    fig = Figure(figsize=(size, size))
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes((0.02, 0.02, 0.96, 0.9 if title else 0.96))
+    if title:
+        ax.set_title(title)
+
+    # line widths are given in points, so they are scaled with the image
+    scale = size / 7
+    ax.add_collection(LineCollection(grid_segments(grid_size),
+                                     linewidths=2*scale, colors='c'))
+    ax.add_collection(LineCollection(border_segments(region_grid(blocks, grid_size)),
+                                     linewidths=4*scale, colors='k'))
+    outline = [[(0, 0), (grid_size, 0), (grid_size, grid_size), (0, grid_size), (0, 0)]]
+    ax.add_collection(LineCollection(outline, linewidths=8*scale, colors='k'))
+
+    if star_locs:
+        cells = np.asarray(star_locs) - 1
+        cell_points = 72*size*0.96 / grid_size
+        ax.scatter(cells % grid_size + 0.5, cells // grid_size + 0.5, marker='*',
+                   s=(0.7*cell_points)**2, color='k', zorder=3)
+
+    # this is done so that 0,0 is the top-left (default is bottom-left)
+    ax.set_xlim(0, grid_size)
+    ax.set_ylim(grid_size, 0)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    fig.savefig(path, dpi=dpi)
+    return path
+
+
+def _render_job(job: tuple):
+    """
+    Unpacks a job for render_many, since pool workers take one argument
+    """
+    blocks, grid_size, star_locs, path, title, size, dpi = job
+    return render_grid(blocks, grid_size, star_locs, path, title, size, dpi)
+
+
+def file_name(index: int, name: str, image_format: str):
+    """
+    :param index: position of the puzzle in the result stream, since
+                  corpora can contain the same puzzle more than once
+    :param name: name of a puzzle, possibly a path
+    :param image_format: extension of the image file
+    :return: a file name safe to use for the rendered image of the puzzle
+    """
+    name = os.path.splitext(os.path.basename(str(name)))[0]
+    return '{:05d}_{}.{}'.format(index, re.sub(r'[^A-Za-z0-9_.-]', '_', name),
+                                 image_format)
+
+
+def render_many(results, out_dir: str, image_format: str = 'png',
+                processes: int = None, size: float = 7, dpi: int = 100,
+                show_titles: bool = True):
+    """
+    Renders a stream of results in parallel worker processes
+
+    :param results: iterable of (name, blocks, grid size, star locations)
+    :param out_dir: directory in which the images are written
+    :param image_format: 'png', 'svg' or any other format matplotlib supports
+    :param processes: number of worker processes, defaults to the cpu count
+    :param size: width and height of the images in inches
+    :param dpi: resolution of raster images
+    :param show_titles: show the name of the puzzle above each grid
+    :return: list of the paths of the written images, in the order of results
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = ((blocks, grid_size, star_locs,
+             os.path.join(out_dir, file_name(i, name, image_format)),
+             str(name) if show_titles else None, size, dpi)
+            for i, (name, blocks, grid_size, star_locs) in enumerate(results))
+    with Pool(processes) as pool:
+        return list(pool.imap(_render_job, jobs, chunksize=8))
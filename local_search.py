@@ -0,0 +1,250 @@
+"""
+    File name: local_search.py
+    Author: Arsh Khokhar, Kiernan Wiese
+    Date last modified: 19 October, 2026
+    Python Version: 3.8
+
+    This script contains a min-conflicts local search with tabu tenure for
+    solving the 2-star problem on large grids, where systematic search gets
+    too slow. It can't prove that a puzzle has no solution. Every star stays
+    in its own block; the search starts from a greedy placement and keeps
+    making the move of a conflicted star within its block that lowers the
+    number of violated constraints the most, with a tabu tenure on vacated
+    cells and random walk moves to escape local minima. The algorithm can be
+    called externally by calling the function local_search, which takes the
+    grid as a 2d array of blocks and the size of the grid as arguments, and
+    returns the same result as backtrack and forward_check.
+"""
+
+import random
+
+from puzzle import Puzzle
+
+MAX_STEPS = 200000
+
+
+def local_search(blocks, grid_size: int, stars: int = 2, max_steps: int = MAX_STEPS,
+                 walk_probability: float = 0.05, tabu_tenure: int = None,
+                 seed: int = None):
+    """
+    Attempts to solve the 2-star problem using min-conflicts local search
+
+    :param blocks: 2-D array containing the blocks, and their contents,
+                   or a Puzzle
+    :param grid_size: Size of the grid (10x10 grid -> 10)
+    :param stars: number of stars per row, column and block, ignored if
+                  blocks is a Puzzle
+    :param max_steps: number of moves after which the search gives up
+    :param walk_probability: probability of making a random move instead
+                             of the best one
+    :param tabu_tenure: number of moves for which a star can't move back to
+                        a cell it left, defaults to a value based on grid size
+    :param seed: seed of the random number generator, for repeatable runs
+    :return assignment: A valid solution of the 2-star csp, None if none was found
+    :return checked_nodes: The number of moves made
+    """
+    puzzle = blocks if isinstance(blocks, Puzzle) else Puzzle(blocks, grid_size, stars)
+    search = MinConflicts(puzzle, random.Random(seed))
+    if tabu_tenure is None:
+        tabu_tenure = max(2, grid_size // 2)
+
+    step = 0
+    while search.cost > 0 and step < max_steps:
+        step += 1
+        search.step(step, walk_probability, tabu_tenure)
+
+    if search.cost > 0:
+        return None, step
+    return search.assignment(), step
+
+
+class MinConflicts:
+    """
+    The state of a min-conflicts search. Star s is the s % stars-th star of
+    block s // stars, the same numbering as the variables of the csp.
+
+    Attributes
+        grid_size       Size of the grid (10x10 grid -> 10)
+        stars           number of stars per row, column and block
+        blocks          blocks of the puzzle, as tuples of cells
+        neighbours      the cell itself and its adjacent cells for each cell
+        rng             random number generator of the search
+        positions       cell of every star
+        occupied        list indexed by cell, True where a star is placed
+        row_count       number of stars in each row
+        col_count       number of stars in each column
+        block_count     number of stars in each block
+        adjacent        list indexed by cell of the number of stars on or
+                            adjacent to each cell
+        tabu_until      list indexed by cell of the step until which no star
+                            may move into the cell
+        cost            number of violated constraints: the distance of every
+                            row and column count from the number of stars plus
+                            the number of pairs of adjacent stars
+    """
+    def __init__(self, puzzle: Puzzle, rng: random.Random):
+        """
+        Constructor for a search, placing the stars greedily block by block
+
+        :param puzzle: the puzzle to be solved
+        :param rng: random number generator of the search
+        """
+        self.grid_size = puzzle.grid_size
+        self.stars = stars = puzzle.stars
+        self.blocks = puzzle.blocks
+        self.neighbours = puzzle.neighbours
+        self.rng = rng
+
+        num_cells = self.grid_size*self.grid_size
+        self.positions = [0]*(stars*len(self.blocks))
+        self.occupied = [False]*(num_cells + 1)
+        self.row_count = [0]*self.grid_size
+        self.col_count = [0]*self.grid_size
+        self.block_count = [0]*len(self.blocks)
+        self.adjacent = [0]*(num_cells + 1)
+        self.tabu_until = [0]*(num_cells + 1)
+        self.cost = 2*self.grid_size*stars  # every row and column is empty
+
+        order = list(range(len(self.blocks)))
+        rng.shuffle(order)
+        for block in order:
+            for i in range(stars):
+                cells = [cell for cell in self.blocks[block] if not self.occupied[cell]]
+                if not cells:
+                    raise ValueError('Block {} has fewer than {} cells'.format(block, stars))
+                best = min(self.add_delta(cell) for cell in cells)
+                cell = rng.choice([cell for cell in cells if self.add_delta(cell) == best])
+                self.place(block*stars + i, cell)
+
+    def deviation(self, count: int):
+        """
+        :return: how far a row or column count is from the number of stars
+        """
+        return abs(count - self.stars)
+
+    def add_delta(self, cell: int):
+        """
+        :param cell: an empty cell
+        :return: change of the cost if a star was added to the cell
+        """
+        row, col = divmod(cell - 1, self.grid_size)
+        return self.deviation(self.row_count[row] + 1) - self.deviation(self.row_count[row]) \
+            + self.deviation(self.col_count[col] + 1) - self.deviation(self.col_count[col]) \
+            + self.adjacent[cell]
+
+    def move_delta(self, old: int, new: int):
+        """
+        :param old: cell of a star
+        :param new: an empty cell
+        :return: change of the cost if the star was moved from old to new
+        """
+        old_row, old_col = divmod(old - 1, self.grid_size)
+        new_row, new_col = divmod(new - 1, self.grid_size)
+        delta = 0
+        if old_row != new_row:
+            delta += self.deviation(self.row_count[old_row] - 1) \
+                - self.deviation(self.row_count[old_row]) \
+                + self.deviation(self.row_count[new_row] + 1) \
+                - self.deviation(self.row_count[new_row])
+        if old_col != new_col:
+            delta += self.deviation(self.col_count[old_col] - 1) \
+                - self.deviation(self.col_count[old_col]) \
+                + self.deviation(self.col_count[new_col] + 1) \
+                - self.deviation(self.col_count[new_col])
+        # pairs broken at the old cell and made at the new one, where the
+        # star itself no longer counts once it has left the old cell
+        made = self.adjacent[new] - (1 if new in self.neighbours[old] else 0)
+        return delta + made - (self.adjacent[old] - 1)
+
+    def conflicts(self, star: int):
+        """
+        :param star: a placed star
+        :return: number of constraints the star takes part in violating
+        """
+        cell = self.positions[star]
+        row, col = divmod(cell - 1, self.grid_size)
+        return max(self.row_count[row] - self.stars, 0) \
+            + max(self.col_count[col] - self.stars, 0) + self.adjacent[cell] - 1
+
+    def place(self, star: int, cell: int):
+        """
+        Places a star in an empty cell and updates the counts and the cost
+        """
+        self.cost += self.add_delta(cell)
+        row, col = divmod(cell - 1, self.grid_size)
+        self.positions[star] = cell
+        self.occupied[cell] = True
+        self.row_count[row] += 1
+        self.col_count[col] += 1
+        self.block_count[star // self.stars] += 1
+        for neighbour in self.neighbours[cell]:
+            self.adjacent[neighbour] += 1
+
+    def remove(self, star: int):
+        """
+        Removes a star from its cell and updates the counts and the cost
+        """
+        cell = self.positions[star]
+        row, col = divmod(cell - 1, self.grid_size)
+        self.occupied[cell] = False
+        self.row_count[row] -= 1
+        self.col_count[col] -= 1
+        self.block_count[star // self.stars] -= 1
+        for neighbour in self.neighbours[cell]:
+            self.adjacent[neighbour] -= 1
+        self.cost -= self.add_delta(cell)
+
+    def step(self, step: int, walk_probability: float, tabu_tenure: int):
+        """
+        Moves one conflicted star within its block, either to a random cell
+        or by the move of a conflicted star that lowers the cost the most
+
+        :param step: number of the current move
+        :param walk_probability: probability of making a random move
+        :param tabu_tenure: number of moves the vacated cell stays tabu
+        """
+        rng = self.rng
+        conflicted = [star for star in range(len(self.positions)) if self.conflicts(star) > 0]
+        new = None
+        if rng.random() < walk_probability:
+            # stars of full blocks (e.g. single cell blocks of 1-star puzzles) can't move
+            walks = []
+            for star in conflicted:
+                free = [cell for cell in self.blocks[star // self.stars] if not self.occupied[cell]]
+                if free:
+                    walks.append((star, free))
+            if walks:
+                star, free = rng.choice(walks)
+                new = rng.choice(free)
+        if new is None:
+            # moving only the single most conflicted star stalls on puzzles
+            # with a unique solution, so the moves of every conflicted star
+            # are compared
+            best, candidates = None, []
+            for star in conflicted:
+                old = self.positions[star]
+                for cell in self.blocks[star // self.stars]:
+                    if self.occupied[cell]:
+                        continue
+                    delta = self.move_delta(old, cell)
+                    # tabu cells are only allowed if they lead to a solution
+                    if self.tabu_until[cell] > step and self.cost + delta > 0:
+                        continue
+                    if best is None or delta < best:
+                        best, candidates = delta, [(star, cell)]
+                    elif delta == best:
+                        candidates.append((star, cell))
+            if not candidates:
+                return
+            star, new = rng.choice(candidates)
+
+        old = self.positions[star]
+        self.remove(star)
+        self.place(star, new)
+        self.tabu_until[old] = step + tabu_tenure + rng.randint(0, 2)
+
+    def assignment(self):
+        """
+        :return: the placement as an assignment of the csp variables
+        """
+        return {star: cell for star, cell in enumerate(self.positions)}
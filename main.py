@@ -13,7 +13,6 @@ import sys
 import time
 
 from backtrack import backtrack
-from grid_display import display_grid
 from grid_file_loader import load_grid_file
 from forward_checking import forward_check
 
@@ -23,6 +22,9 @@ def main():
         print('Usage: python main.py [fc or bt] [heuristic type (0,1,2,or 3)]')
         exit(-1)
 
+    # imported here since matplotlib is slow to import
+    from grid_display import display_grid
+
     try:
         blocks_8x8, grid_size_8x8 = load_grid_file('grid8x8.txt')
         blocks_10x10, grid_size_10x10 = load_grid_file('grid10x10.txt')
@@ -0,0 +1,221 @@
+"""
+    File name: profiling.py
+    Author: Arsh Khokhar, Kiernan Wiese
+    Date last modified: 19 October, 2026
+    Python Version: 3.8
+
+    This script contains optional instrumentation of the hot paths of the
+    csp. While a Profiler is enabled, the methods listed in PHASES are
+    replaced on the Csp class by wrappers that count every call and time
+    one call in every sample_every, which costs far less than running the
+    whole search under cProfile. Disabling it puts the original methods
+    back, so the search runs exactly the same code as without profiling.
+    The results can be printed as a table or written as collapsed stacks
+    (one "frame;frame count" line per stack) for flamegraph tools.
+"""
+
+import time
+
+from CSP import Csp
+from tables import format_table
+
+PHASES = ['is_consistent', 'propagate_constraints', 'restore_domains',
+          'get_next_unassigned_var', 'incident_edges']
+SAMPLE_EVERY = 16
+
+
+class PhaseStats:
+    """
+    Counters of a single instrumented method
+
+    Attributes
+        calls       number of calls
+        sampled     number of calls that were timed
+        time        total time of the timed calls in seconds
+    """
+    __slots__ = ('calls', 'sampled', 'time')
+
+    def __init__(self):
+        self.calls = 0
+        self.sampled = 0
+        self.time = 0.0
+
+    @property
+    def estimated_time(self):
+        """
+        Time spent in all the calls, estimated from the timed ones
+        """
+        if not self.sampled:
+            return 0.0
+        return self.time / self.sampled * self.calls
+
+
+class Profiler:
+    """
+    Sampled per-phase timers and counters of the csp methods
+
+    Attributes
+        sample_every    one call in every sample_every calls is timed
+        runs            list of (label, run time) of the runs made with run
+        stats           dict mapping each label to a dict of the PhaseStats
+                            of every phase
+        current         stats of the phases of the label in use, which the
+                            wrappers count into
+        originals       methods replaced while enabled, None while disabled
+    """
+    active = None
+
+    def __init__(self, sample_every: int = SAMPLE_EVERY):
+        self.sample_every = max(1, sample_every)
+        self.runs = []
+        self.stats = {}
+        self.current = None
+        self.originals = None
+        self.set_label('search')
+
+    def set_label(self, label: str):
+        """
+        Makes the following calls count towards a label, the root of their stacks
+        """
+        if label not in self.stats:
+            self.stats[label] = {phase: PhaseStats() for phase in PHASES}
+        self.current = self.stats[label]
+
+    def enable(self):
+        """
+        Replaces the instrumented methods of Csp by counting wrappers
+        """
+        if Profiler.active is self:
+            return
+        if Profiler.active is not None:
+            raise RuntimeError('Another profiler is already enabled')
+        self.originals = {phase: Csp.__dict__[phase] for phase in PHASES}
+        for phase, method in self.originals.items():
+            setattr(Csp, phase, self._wrap(phase, method))
+        Profiler.active = self
+
+    def disable(self):
+        """
+        Puts the original methods of Csp back
+        """
+        if Profiler.active is not self:
+            return
+        for phase, method in self.originals.items():
+            setattr(Csp, phase, method)
+        self.originals = None
+        Profiler.active = None
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disable()
+
+    def _wrap(self, phase: str, method):
+        """
+        :return: a wrapper of method counting its calls into the stats of the
+                 current label and timing every sample_every-th call
+        """
+        profiler = self
+        sample_every = self.sample_every
+        perf_counter = time.perf_counter
+
+        def wrapper(*args):
+            stats = profiler.current[phase]
+            stats.calls += 1
+            if stats.calls % sample_every:
+                return method(*args)
+            start = perf_counter()
+            result = method(*args)
+            stats.time += perf_counter() - start
+            stats.sampled += 1
+            return result
+
+        wrapper.__name__ = method.__name__
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+
+    def run(self, label: str, func, *args, **kwargs):
+        """
+        Calls a function with profiling enabled, recording the stats of the
+        calls made by it under a label
+
+        :param label: name of the run, e.g. the algorithm and heuristic
+        :param func: function to call, e.g. forward_check
+        :return: whatever func returns
+        """
+        was_enabled = Profiler.active is self
+        self.enable()
+        self.set_label(label)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.runs.append((label, time.perf_counter() - start))
+            if not was_enabled:
+                self.disable()
+
+    def run_times(self):
+        """
+        :return: dict mapping each label to the total time of its runs
+        """
+        run_times = {}
+        for label, run_time in self.runs:
+            run_times[label] = run_times.get(label, 0.0) + run_time
+        return run_times
+
+    def summary_rows(self):
+        """
+        :return: table rows of label, phase, calls, timed calls, estimated
+                 time and share of the run time of the label, slowest
+                 phases first
+        """
+        run_times = self.run_times()
+        rows = []
+        for label, phases in self.stats.items():
+            run_time = run_times.get(label)
+            for phase, stats in sorted(phases.items(), key=lambda item: -item[1].estimated_time):
+                if not stats.calls:
+                    continue
+                rows.append([label, phase, stats.calls, stats.sampled,
+                             '{:.4g} sec'.format(stats.estimated_time),
+                             '{:.1f}%'.format(100*stats.estimated_time / run_time)
+                             if run_time else '-'])
+        return rows
+
+    def format_summary(self):
+        """
+        :return: the summary as a table in the format of investigation.txt
+        """
+        return format_table(['Run', 'Phase', 'Calls', 'Timed calls', 'Estimated time',
+                             'Share'], self.summary_rows())
+
+    def collapsed_stacks(self):
+        """
+        :return: lines of "label;phase microseconds", plus "label microseconds"
+                 for the time of each run spent outside the phases. Spaces
+                 in labels are replaced by underscores
+        """
+        run_times = self.run_times()
+        lines = []
+        for label, phases in self.stats.items():
+            frame = label.replace(' ', '_')
+            phase_time = 0.0
+            for phase, stats in phases.items():
+                if stats.calls:
+                    phase_time += stats.estimated_time
+                    lines.append('{};{} {}'.format(frame, phase, round(stats.estimated_time*1e6)))
+            if label in run_times:
+                rest = max(run_times[label] - phase_time, 0.0)
+                lines.append('{} {}'.format(frame, round(rest*1e6)))
+        return lines
+
+    def write_collapsed(self, path: str):
+        """
+        Writes the collapsed stacks to a file, e.g. for flamegraph.pl or speedscope
+
+        :param path: path of the file to be written
+        """
+        with open(path, 'w') as file:
+            file.write('\n'.join(self.collapsed_stacks()) + '\n')
@@ -0,0 +1,126 @@
+"""
+    File name: puzzle.py
+    Author: Arsh Khokhar, Kiernan Wiese
+    Date last modified: 19 October, 2026
+    Python Version: 3.8
+
+    This script contains the Puzzle class, an immutable definition of a
+    2-star puzzle grid. It holds only the static data of a puzzle (the grid
+    size and the block of every cell), so a single instance can be shared by
+    any number of csp instances searching it at the same time. It is stored
+    as the bytes of the block ids, which is all that gets pickled when it is
+    sent to another process.
+"""
+
+from collections import namedtuple
+from types import MappingProxyType
+
+# block of a cell and the variables whose domains contain it
+Cell = namedtuple('Cell', ('block', 'in_domains_of'))
+
+
+class Puzzle:
+    """
+    An immutable 2-star puzzle grid
+
+    Attributes
+        grid_size           Size of the grid (10x10 grid -> 10)
+        stars               number of stars in every row, column and block,
+                                2 for the 2-star puzzle
+        regions             bytes holding the block id of every cell, in row
+                                major order
+        blocks              tuple of blocks, each a sorted tuple of its cells.
+                                Cells are numbered from 1 in row major order
+        cell_map            read-only mapping of each cell to a Cell holding
+                                its block and the indices of the variables
+        neighbours          tuple indexed by cell holding the cell itself and
+                                the cells adjacent to it (index 0 is unused)
+    """
+    __slots__ = ('grid_size', 'stars', 'regions', 'blocks', 'cell_map', 'neighbours')
+
+    def __init__(self, blocks, grid_size: int, stars: int = 2):
+        """
+        Constructor for a puzzle from the blocks of the grid
+
+        :param blocks: list of all the blocks in the grid
+        :param grid_size: size of the input grid
+        :param stars: number of stars in every row, column and block
+        """
+        if len(blocks) > 256:
+            raise ValueError('A puzzle can have at most 256 blocks')
+        regions = bytearray(grid_size*grid_size)
+        seen = 0
+        for i, block in enumerate(blocks):
+            for cell in block:
+                regions[cell - 1] = i
+            seen += len(block)
+        if seen != grid_size*grid_size:
+            raise ValueError('The blocks cover {} cells of a {}x{} grid'
+                             .format(seen, grid_size, grid_size))
+        self._init(grid_size, stars, bytes(regions))
+
+    @classmethod
+    def from_regions(cls, grid_size: int, regions, stars: int = 2):
+        """
+        Constructs a puzzle from the block id of every cell
+
+        :param grid_size: size of the input grid
+        :param regions: bytes-like object with the block id of every cell,
+                        in row major order (e.g. PuzzleView.regions)
+        :param stars: number of stars in every row, column and block
+        :return: the new puzzle
+        """
+        if len(regions) != grid_size*grid_size:
+            raise ValueError('Expected {} region ids, got {}'
+                             .format(grid_size*grid_size, len(regions)))
+        puzzle = cls.__new__(cls)
+        puzzle._init(grid_size, stars, bytes(regions))
+        return puzzle
+
+    def _init(self, grid_size: int, stars: int, regions: bytes):
+        """
+        Sets the attributes and builds the lookup tables derived from regions
+        """
+        blocks = [[] for _ in range(max(regions) + 1)]
+        for i, region in enumerate(regions):
+            blocks[region].append(i + 1)
+
+        cell_map = {}
+        for i, block in enumerate(blocks):
+            for cell in block:
+                cell_map[cell] = Cell(i, tuple(range(stars*i, stars*i + stars)))
+
+        neighbours = [()]
+        for cell in range(grid_size*grid_size):
+            row, col = divmod(cell, grid_size)
+            neighbours.append(tuple(r*grid_size + c + 1
+                                    for r in range(max(row - 1, 0), min(row + 2, grid_size))
+                                    for c in range(max(col - 1, 0), min(col + 2, grid_size))))
+
+        object.__setattr__(self, 'grid_size', grid_size)
+        object.__setattr__(self, 'stars', stars)
+        object.__setattr__(self, 'regions', regions)
+        object.__setattr__(self, 'blocks', tuple(tuple(block) for block in blocks))
+        object.__setattr__(self, 'cell_map', MappingProxyType(cell_map))
+        object.__setattr__(self, 'neighbours', tuple(neighbours))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Puzzle is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('Puzzle is immutable')
+
+    def __reduce__(self):
+        # only the block ids are pickled, the lookup tables are rebuilt
+        return Puzzle.from_regions, (self.grid_size, self.regions, self.stars)
+
+    def __eq__(self, other):
+        return isinstance(other, Puzzle) and self.grid_size == other.grid_size \
+            and self.stars == other.stars and self.regions == other.regions
+
+    def __hash__(self):
+        return hash((self.grid_size, self.stars, self.regions))
+
+    def __repr__(self):
+        return 'Puzzle({}x{}, {} stars, {} blocks)'.format(self.grid_size, self.grid_size,
+                                                           self.stars, len(self.blocks))
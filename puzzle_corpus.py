@@ -0,0 +1,411 @@
+"""
+    File name: puzzle_corpus.py
+    Author: Arsh Khokhar, Kiernan Wiese
+    Date last modified: 19 October, 2026
+    Python Version: 3.8
+
+    This script contains a compact binary format for storing large corpora of
+    star puzzles, a memory-mapped reader for it, and converters to and from
+    the JSON format used in the Examples folder and the gridNxN.txt format.
+
+    File layout (all integers little endian):
+        header      magic b'2SPC', format version (uint16), reserved (uint16),
+                    number of records (uint32)
+        index       one uint64 byte offset per record
+        records     width, height, stars, flags (uint8 each), puzzle id
+                    (32 bytes, NUL padded), the region id of every cell as a
+                    byte (row major), and the solution as a bitmask with one
+                    bit per cell (cell i is bit i % 8 of byte i // 8)
+
+    Records of the same grid size have the same size, so a corpus of a single
+    grid size is a plain array of fixed-size records. The index still allows
+    mixing grid sizes in one file.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+
+from grid_file_loader import load_grid_file
+
+MAGIC = b'2SPC'
+FORMAT_VERSION = 1
+PUZZLE_ID_LENGTH = 32
+FLAG_HAS_SOLUTION = 1
+
+HEADER = struct.Struct('<4sHHI')
+INDEX_ENTRY = struct.Struct('<Q')
+RECORD_HEADER = struct.Struct('<BBBB{}s'.format(PUZZLE_ID_LENGTH))
+
+
+def record_size(width: int, height: int):
+    """
+    Size in bytes of a single record for a grid of the given dimensions
+
+    :param width: width of the grid
+    :param height: height of the grid
+    :return: size of the record in bytes
+    """
+    num_cells = width*height
+    return RECORD_HEADER.size + num_cells + (num_cells + 7) // 8
+
+
+def encode_record(puzzle_id: str, grid_size: int, stars: int,
+                  regions, solved: str = None):
+    """
+    Encodes a single puzzle as a binary record
+
+    :param puzzle_id: identifier of the puzzle, truncated to 32 bytes
+    :param grid_size: size of the grid (10x10 grid -> 10)
+    :param stars: number of stars per row, column and block
+    :param regions: region (block) id of every cell, row major, 0 indexed
+    :param solved: solution as a string of '0' and '1' per cell, if known
+    :return: the encoded record as bytes
+    """
+    num_cells = grid_size*grid_size
+    if len(regions) != num_cells:
+        raise ValueError('Expected {} region ids, got {}'
+                         .format(num_cells, len(regions)))
+    solution = bytearray((num_cells + 7) // 8)
+    flags = 0
+    if solved:
+        flags |= FLAG_HAS_SOLUTION
+        for i, char in enumerate(solved):
+            if char == '1':
+                solution[i >> 3] |= 1 << (i & 7)
+    header = RECORD_HEADER.pack(grid_size, grid_size, stars, flags,
+                                puzzle_id.encode('utf-8')[:PUZZLE_ID_LENGTH])
+    return header + bytes(regions) + bytes(solution)
+
+
+def write_corpus(path: str, records):
+    """
+    Writes encoded records to a corpus file along with the header and index
+
+    :param path: path of the corpus file to be written
+    :param records: iterable of records produced by encode_record
+    :return: number of records written
+    """
+    records = list(records)
+    offset = HEADER.size + INDEX_ENTRY.size*len(records)
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(records)))
+        for record in records:
+            file.write(INDEX_ENTRY.pack(offset))
+            offset += len(record)
+        for record in records:
+            file.write(record)
+    return len(records)
+
+
+class PuzzleView:
+    """
+    A zero-copy view of a single puzzle record in a memory-mapped corpus
+
+    Attributes
+        index       index of the record in the corpus
+        record      memoryview over the bytes of the record
+    """
+    __slots__ = ('index', 'record')
+
+    def __init__(self, index: int, record: memoryview):
+        self.index = index
+        self.record = record
+
+    @property
+    def width(self):
+        return self.record[0]
+
+    @property
+    def height(self):
+        return self.record[1]
+
+    @property
+    def grid_size(self):
+        return self.record[0]
+
+    @property
+    def stars(self):
+        return self.record[2]
+
+    @property
+    def has_solution(self):
+        return bool(self.record[3] & FLAG_HAS_SOLUTION)
+
+    @property
+    def puzzle_id(self):
+        raw = bytes(self.record[4:RECORD_HEADER.size])
+        return raw.rstrip(b'\0').decode('utf-8', errors='replace')
+
+    @property
+    def regions(self):
+        """
+        Region id of every cell (row major) as a memoryview of bytes
+        """
+        start = RECORD_HEADER.size
+        return self.record[start:start + self.width*self.height]
+
+    @property
+    def solution(self):
+        """
+        Solution bitmask as a memoryview of bytes
+        """
+        start = RECORD_HEADER.size + self.width*self.height
+        return self.record[start:start + (self.width*self.height + 7) // 8]
+
+    def blocks(self):
+        """
+        Builds the 2D list of blocks used by the csp algorithms
+
+        :return: 2D list of blocks, cells numbered from 1 in row major order
+        """
+        blocks = [[] for _ in range(max(self.regions) + 1)]
+        for i, region in enumerate(self.regions):
+            blocks[region].append(i + 1)
+        return blocks
+
+    def star_cells(self):
+        """
+        :return: list of cells (numbered from 1) holding a star in the
+                 stored solution, empty if there's no stored solution
+        """
+        solution = self.solution
+        return [i + 1 for i in range(self.width*self.height)
+                if solution[i >> 3] >> (i & 7) & 1]
+
+    def puzz_string(self):
+        """
+        :return: the regions as a string of letters, as in the Examples JSON
+        """
+        return ''.join(chr(ord('A') + region) for region in self.regions)
+
+    def solved_string(self):
+        """
+        :return: the solution as a string of '0' and '1' per cell, or None
+                 if the record has no stored solution
+        """
+        if not self.has_solution:
+            return None
+        solution = self.solution
+        return ''.join('1' if solution[i >> 3] >> (i & 7) & 1 else '0'
+                       for i in range(self.width*self.height))
+
+
+class CorpusReader:
+    """
+    Memory-mapped reader for binary puzzle corpora. Puzzles can be accessed
+    by index or slice and are returned as PuzzleView objects referencing the
+    mapped file directly, so nothing is parsed until it is used. Views must
+    not be used after the reader is closed.
+
+    Attributes
+        path        path of the corpus file
+        offsets     memoryview over the index of record offsets
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+
+        magic, version, _, count = HEADER.unpack_from(self._buffer)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError('{} is not a puzzle corpus file'.format(path))
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError('Unsupported corpus format version {}'
+                             .format(version))
+        index_end = HEADER.size + INDEX_ENTRY.size*count
+        self.offsets = self._buffer[HEADER.size:index_end].cast('Q')
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._view(i) for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError('corpus index out of range')
+        return self._view(key)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._view(i)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _view(self, index: int):
+        offset = self.offsets[index]
+        width, height = self._buffer[offset], self._buffer[offset + 1]
+        return PuzzleView(index, self._buffer[offset:offset + record_size(width, height)])
+
+    def close(self):
+        """
+        Releases the mapping. If views are still referenced the mapping is
+        only released once they are garbage collected.
+        """
+        if getattr(self, 'offsets', None) is not None:
+            self.offsets.release()
+        self._buffer.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+
+def blocks_to_regions(blocks: list, grid_size: int):
+    """
+    Converts the 2D list of blocks to a row major list of region ids
+
+    :param blocks: 2-D array containing the blocks, and their contents.
+    :param grid_size: Size of the grid (10x10 grid -> 10)
+    :return: list with the region id of every cell
+    """
+    regions = [0]*(grid_size*grid_size)
+    for i, block in enumerate(blocks):
+        for cell in block:
+            regions[cell - 1] = i
+    return regions
+
+
+def load_json_corpus(json_path: str):
+    """
+    Reads a JSON corpus in the Examples format. Some of the corpora end with
+    a stray semicolon after the list, which is ignored.
+
+    :param json_path: path of the JSON corpus
+    :return: list of the puzzle entries
+    """
+    with open(json_path, 'r') as file:
+        return json.loads(file.read().strip().rstrip(';'))
+
+
+def entry_blocks(entry: dict):
+    """
+    Gives the blocks of an entry of a JSON corpus, whose "puzz" string holds
+    the block of every cell as a letter from A
+
+    :param entry: entry of a corpus in the Examples format
+    :return: (blocks, grid size, stars) with the blocks as for backtrack and
+             forward_check
+    """
+    data = entry['puzzle_data']
+    blocks = [[] for _ in range(data['width'])]
+    for i, char in enumerate(data['puzz']):
+        blocks[ord(char) - ord('A')].append(i + 1)
+    return blocks, data['width'], data.get('stars', 2)
+
+
+def json_to_corpus(json_path: str, corpus_path: str):
+    """
+    Converts a JSON corpus in the Examples format to a binary corpus
+
+    :param json_path: path of the JSON corpus
+    :param corpus_path: path of the binary corpus to be written
+    :return: number of puzzles converted
+    """
+    entries = load_json_corpus(json_path)
+    records = []
+    for entry in entries:
+        data = entry['puzzle_data']
+        if data['width'] != data['height']:
+            raise ValueError('Only square grids are supported')
+        regions = [ord(char) - ord('A') for char in data['puzz']]
+        records.append(encode_record(entry.get('puzzle_id', data.get('ptitle', '')),
+                                     data['width'], data.get('stars', 2),
+                                     regions, data.get('solved')))
+    return write_corpus(corpus_path, records)
+
+
+def corpus_to_json(corpus_path: str, json_path: str):
+    """
+    Converts a binary corpus back to the JSON format of the Examples folder.
+    Only the fields stored in the binary format are written.
+
+    :param corpus_path: path of the binary corpus
+    :param json_path: path of the JSON corpus to be written
+    :return: number of puzzles converted
+    """
+    entries = []
+    with CorpusReader(corpus_path) as reader:
+        for puzzle in reader:
+            data = {'puzz': puzzle.puzz_string(),
+                    'width': puzzle.width,
+                    'height': puzzle.height,
+                    'stars': puzzle.stars,
+                    'ptitle': puzzle.puzzle_id}
+            if puzzle.has_solution:
+                data['solved'] = puzzle.solved_string()
+            entries.append({'puzzle_data': data,
+                            'puzzle_id': puzzle.puzzle_id,
+                            'success': puzzle.has_solution})
+    with open(json_path, 'w') as file:
+        json.dump(entries, file, indent=2)
+    return len(entries)
+
+
+def grid_files_to_corpus(grid_paths: list, corpus_path: str, stars: int = 2):
+    """
+    Converts gridNxN.txt files to a binary corpus
+
+    :param grid_paths: paths of the grid files
+    :param corpus_path: path of the binary corpus to be written
+    :param stars: number of stars per row, column and block
+    :return: number of puzzles converted
+    """
+    records = []
+    for path in grid_paths:
+        blocks, grid_size = load_grid_file(path)
+        records.append(encode_record(os.path.basename(path), grid_size, stars,
+                                     blocks_to_regions(blocks, grid_size)))
+    return write_corpus(corpus_path, records)
+
+
+def corpus_to_grid_file(corpus_path: str, index: int, grid_path: str):
+    """
+    Writes a single puzzle of a binary corpus as a grid file
+
+    :param corpus_path: path of the binary corpus
+    :param index: index of the puzzle in the corpus
+    :param grid_path: path of the grid file to be written
+    """
+    with CorpusReader(corpus_path) as reader:
+        blocks = reader[index].blocks()
+    with open(grid_path, 'w') as file:
+        file.write('\n'.join('Block{}\t{}'.format(i + 1, ','.join(map(str, block)))
+                             for i, block in enumerate(blocks)))
+
+
+def main():
+    usage = ('Usage: python puzzle_corpus.py to-binary [corpus.json] [corpus.spc]\n'
+             '       python puzzle_corpus.py to-json [corpus.spc] [corpus.json]\n'
+             '       python puzzle_corpus.py from-grids [corpus.spc] [gridNxN.txt ...]')
+    if len(sys.argv) < 4:
+        print(usage)
+        exit(-1)
+
+    command = sys.argv[1].lower()
+    if command == 'to-binary':
+        count = json_to_corpus(sys.argv[2], sys.argv[3])
+    elif command == 'to-json':
+        count = corpus_to_json(sys.argv[2], sys.argv[3])
+    elif command == 'from-grids':
+        count = grid_files_to_corpus(sys.argv[3:], sys.argv[2])
+    else:
+        print(usage)
+        exit(-1)
+    print('Converted {} puzzles'.format(count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+"""
+    File name: puzzle_generator.py
+    Author: Arsh Khokhar, Kiernan Wiese
+    Date last modified: 19 October, 2026
+    Python Version: 3.8
+
+    This script contains a generator of random k-star puzzles of any size,
+    used to benchmark the solvers on grids and star counts that the puzzle
+    files don't cover. A random solution is placed first, row by row, and
+    then grown into blocks: every block starts from one of the stars and
+    claims paths to the nearest unclaimed stars until it holds k of them,
+    after which the cells left over are added to neighbouring blocks. Every
+    generated puzzle has at least one solution, but not necessarily only one.
+"""
+
+import argparse
+import random
+
+from collections import deque
+from itertools import combinations
+
+MAX_ATTEMPTS = 100
+GROW_ATTEMPTS = 20
+
+
+def random_solution(grid_size: int, stars: int, rng: random.Random):
+    """
+    Places stars so that every row and column has the given number of stars
+    and no two stars are adjacent, using a randomized depth first search
+    over the rows
+
+    :param grid_size: Size of the grid (10x10 grid -> 10)
+    :param stars: number of stars in every row and column
+    :param rng: random number generator
+    :return: sorted list of the cells with stars, None if none was found
+             within the node limit
+    """
+    rows = [(sum(1 << col for col in cols), cols)
+            for cols in combinations(range(grid_size), stars)
+            if all(b - a > 1 for a, b in zip(cols, cols[1:]))]
+    if not rows:
+        return None
+    col_count = [0]*grid_size
+    placed = []
+    budget = [50*grid_size*grid_size]
+
+    def place_row(row: int, previous: int):
+        if row == grid_size:
+            return True
+        rows_left = grid_size - row - 1
+        need = [stars - count for count in col_count]
+        # a column can get a star at most every other row, so the columns
+        # that would run out of rows must get one now, and a column that
+        # gets one now has to fit the rest in the rows after the next one
+        forced = sum(1 << col for col in range(grid_size) if need[col] > (rows_left + 1) // 2)
+        allowed = sum(1 << col for col in range(grid_size)
+                      if 0 < need[col] <= rows_left // 2 + 1)
+        blocked = previous | previous << 1 | previous >> 1 | ~allowed
+        # columns that still need the most stars are tried first, with
+        # random ties, which keeps the last rows from running out of options
+        candidates = [(rng.random() - sum(need[col] for col in cols), mask)
+                      for mask, cols in rows
+                      if not mask & blocked and mask & forced == forced]
+        for _, mask in sorted(candidates):
+            budget[0] -= 1
+            if budget[0] < 0:
+                return False
+            for col in range(grid_size):
+                col_count[col] += mask >> col & 1
+            placed.append(mask)
+            if place_row(row + 1, mask):
+                return True
+            placed.pop()
+            for col in range(grid_size):
+                col_count[col] -= mask >> col & 1
+        return False
+
+    if not place_row(0, 0):
+        return None
+    return sorted(row*grid_size + col + 1 for row, mask in enumerate(placed)
+                  for col in range(grid_size) if mask >> col & 1)
+
+
+def grow_blocks(grid_size: int, stars: int, solution: list, rng: random.Random):
+    """
+    Grows grid_size connected blocks with exactly the given number of stars
+    from a solution
+
+    :param grid_size: Size of the grid (10x10 grid -> 10)
+    :param stars: number of stars in every block
+    :param solution: cells with stars, from random_solution
+    :param rng: random number generator
+    :return: list of blocks, each a sorted list of its cells, None if the
+             stars couldn't be grouped into connected blocks
+    """
+    num_cells = grid_size*grid_size
+    neighbours = [[] for _ in range(num_cells + 1)]
+    for cell in range(1, num_cells + 1):
+        row, col = divmod(cell - 1, grid_size)
+        if row > 0:
+            neighbours[cell].append(cell - grid_size)
+        if row < grid_size - 1:
+            neighbours[cell].append(cell + grid_size)
+        if col > 0:
+            neighbours[cell].append(cell - 1)
+        if col < grid_size - 1:
+            neighbours[cell].append(cell + 1)
+
+    is_star = [False]*(num_cells + 1)
+    for cell in solution:
+        is_star[cell] = True
+    owner = [-1]*(num_cells + 1)
+    blocks = [[] for _ in range(grid_size)]
+    star_count = [1]*grid_size
+    for block, cell in enumerate(rng.sample(solution, grid_size)):
+        owner[cell] = block
+        blocks[block].append(cell)
+
+    # blocks take turns claiming the path to their nearest unclaimed star,
+    # without crossing other stars on the way
+    for _ in range(stars - 1):
+        for block in rng.sample(range(grid_size), grid_size):
+            parent = {cell: None for cell in blocks[block]}
+            queue = deque(blocks[block])
+            target = None
+            while queue and target is None:
+                cell = queue.popleft()
+                adjacent = neighbours[cell][:]
+                rng.shuffle(adjacent)
+                for neighbour in adjacent:
+                    if neighbour in parent or owner[neighbour] != -1:
+                        continue
+                    parent[neighbour] = cell
+                    if is_star[neighbour]:
+                        target = neighbour
+                        break
+                    queue.append(neighbour)
+            if target is None:
+                return None
+            while owner[target] == -1:
+                owner[target] = block
+                blocks[block].append(target)
+                target = parent[target]
+            star_count[block] += 1
+
+    # the cells left over join a random adjacent block
+    unowned = [cell for cell in range(1, num_cells + 1) if owner[cell] == -1]
+    while unowned:
+        rng.shuffle(unowned)
+        remaining = []
+        for cell in unowned:
+            owners = [owner[neighbour] for neighbour in neighbours[cell]
+                      if owner[neighbour] != -1]
+            if owners:
+                block = rng.choice(owners)
+                owner[cell] = block
+                blocks[block].append(cell)
+            else:
+                remaining.append(cell)
+        unowned = remaining
+    return [sorted(block) for block in blocks]
+
+
+def generate_puzzle(grid_size: int, stars: int = 2, seed: int = None):
+    """
+    Generates a random puzzle with at least one solution
+
+    :param grid_size: Size of the grid (10x10 grid -> 10)
+    :param stars: number of stars in every row, column and block
+    :param seed: seed of the random number generator, for repeatable puzzles
+    :return blocks: list of blocks, each a sorted list of its cells
+    :return solution: sorted list of the cells with stars in a solution
+    """
+    rng = random.Random(seed)
+    for _ in range(MAX_ATTEMPTS):
+        solution = random_solution(grid_size, stars, rng)
+        if solution is None:
+            continue
+        for _ in range(GROW_ATTEMPTS):
+            blocks = grow_blocks(grid_size, stars, solution, rng)
+            if blocks is not None:
+                return blocks, solution
+    raise ValueError("Couldn't generate a {}x{} puzzle with {} stars"
+                     .format(grid_size, grid_size, stars))
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description='Generate random k-star puzzles as grid files.')
+    parser.add_argument('grid_size', type=int, help='size of the grid')
+    parser.add_argument('-k', '--stars', type=int, default=2,
+                        help='number of stars per row, column and block')
+    parser.add_argument('-s', '--seed', type=int, default=None,
+                        help='seed of the random number generator')
+    parser.add_argument('-o', '--output', default=None,
+                        help='grid file to write, defaults to printing the puzzle')
+    args = parser.parse_args(argv)
+
+    blocks, _ = generate_puzzle(args.grid_size, args.stars, args.seed)
+    lines = ['Block{}\t{}'.format(i + 1, ','.join(str(cell) for cell in block))
+             for i, block in enumerate(blocks)]
+    if args.output is None:
+        print('\n'.join(lines))
+    else:
+        with open(args.output, 'w') as file:
+            file.write('\n'.join(lines) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+"""
+    File name: session.py
+    Author: Arsh Khokhar, Kiernan Wiese
+    Date last modified: 19 October, 2026
+    Python Version: 3.8
+
+    This script contains the SolveSession class, an incremental interface to
+    the 2-star csp for interactive play. Stars can be placed and removed and
+    cells marked empty one move at a time; every move is propagated into the
+    domains of a single csp instance that is kept between calls, so checking
+    a move, finding the next forced move or checking that the board can still
+    be solved doesn't start over from an empty grid.
+"""
+
+import time
+
+from CSP import Csp
+from forward_checking import recursive_forward_check
+from puzzle import Puzzle
+
+STAR = 'star'
+EMPTY = 'empty'
+
+
+class SolveSession:
+    """
+    An incremental solving session over a single puzzle
+
+    Attributes
+        puzzle          the puzzle being played
+        csp             csp holding the domains propagated from the moves so far
+        assignment      current assignment of the csp (variable -> cell)
+        moves           moves made so far, in order, as (STAR or EMPTY, cell)
+        applied         moves applied to the csp, as (kind, cell, variable,
+                            changed domains), used to undo them
+        contradiction   the first move that contradicted the moves before it,
+                            None if the board is consistent. Moves made after
+                            a contradiction are recorded but not applied
+        solution        last solution found for the board, reused while the
+                            moves made since are consistent with it
+    """
+    def __init__(self, blocks, grid_size: int, stars: int = 2):
+        """
+        Constructor for a session on an empty board
+
+        :param blocks: list of all the blocks in the grid, or a Puzzle
+        :param grid_size: size of the input grid
+        :param stars: number of stars in every row, column and block, ignored
+                      if blocks is a Puzzle
+        """
+        self.puzzle = blocks if isinstance(blocks, Puzzle) else Puzzle(blocks, grid_size, stars)
+        self.moves = []
+        self.solution = None
+        self.reset()
+
+    def reset(self):
+        """
+        Rebuilds the csp and replays all the recorded moves on it
+        """
+        # heuristic 1 since the edge counts of heuristic 2 can only undo one move
+        self.csp = Csp(self.puzzle, self.puzzle.grid_size, 1)
+        self.assignment = {}
+        self.applied = []
+        self.contradiction = None
+        for move in self.moves:
+            self._apply(*move)
+
+    @property
+    def stars(self):
+        return sorted(cell for kind, cell in self.moves if kind == STAR)
+
+    @property
+    def empty_cells(self):
+        return sorted(cell for kind, cell in self.moves if kind == EMPTY)
+
+    def place_star(self, cell: int):
+        """
+        Places a star in a cell
+
+        :param cell: cell in which the star is placed
+        :return: True if the board is still consistent, False otherwise
+        """
+        if (STAR, cell) in self.moves:
+            return self.is_consistent()
+        if (EMPTY, cell) in self.moves:
+            self.unmark_empty(cell)
+        self.moves.append((STAR, cell))
+        return self._apply(STAR, cell)
+
+    def remove_star(self, cell: int):
+        """
+        Removes a star from a cell
+
+        :param cell: cell from which the star is removed
+        :return: True if the board is consistent, False otherwise
+        """
+        return self._remove_move((STAR, cell))
+
+    def mark_empty(self, cell: int):
+        """
+        Marks a cell as not holding a star
+
+        :param cell: cell to be marked
+        :return: True if the board is still consistent, False otherwise
+        """
+        if (EMPTY, cell) in self.moves:
+            return self.is_consistent()
+        if (STAR, cell) in self.moves:
+            self.remove_star(cell)
+        self.moves.append((EMPTY, cell))
+        return self._apply(EMPTY, cell)
+
+    def unmark_empty(self, cell: int):
+        """
+        Removes the empty mark of a cell
+
+        :param cell: cell to be unmarked
+        :return: True if the board is consistent, False otherwise
+        """
+        return self._remove_move((EMPTY, cell))
+
+    def is_consistent(self):
+        """
+        :return: True if none of the moves contradicted the ones before them
+        """
+        return self.contradiction is None
+
+    def is_solvable(self):
+        """
+        Check if the current board can still be completed to a solution
+
+        :return: True if the board can be completed, False otherwise
+        """
+        return self.find_solution() is not None
+
+    def find_solution(self):
+        """
+        Finds a solution that extends the current board. The last solution
+        found is reused if it agrees with every move, otherwise the search
+        starts from the propagated domains of the current board.
+
+        :return: sorted list of the cells with stars, None if there's no solution
+        """
+        if not self.is_consistent():
+            return None
+        if self.solution is not None and self._agrees_with(self.solution):
+            return self.solution
+
+        # search on a copy, so the domains of the session are left untouched
+        csp = self.csp.copy()
+        csp.start_time = time.time()
+        result = recursive_forward_check(dict(self.assignment), csp)
+        if result and result[0]:
+            self.solution = sorted(result[0].values())
+            return self.solution
+        return None
+
+    def next_forced_move(self):
+        """
+        Finds a move implied by the propagated domains of the current board:
+        a star in the only cell left for a variable, or an empty mark on a
+        cell that no unassigned variable can take anymore
+
+        :return: (STAR or EMPTY, cell), None if there's no forced move or
+                 the board is inconsistent
+        """
+        if not self.is_consistent():
+            return None
+        for var in self.csp.unassigned_vars:
+            domain = self.csp.domains[var]
+            if len(domain) == 1:
+                return STAR, next(iter(domain))
+
+        possible = set()
+        for var in self.csp.unassigned_vars:
+            possible.update(self.csp.domains[var])
+        marked = set(cell for _, cell in self.moves)
+        for cell in range(1, self.puzzle.grid_size**2 + 1):
+            if cell not in possible and cell not in marked:
+                return EMPTY, cell
+        return None
+
+    def hint(self):
+        """
+        Gives the next forced move if there is one, otherwise a star from a
+        solution of the current board
+
+        :return: (STAR or EMPTY, cell), None if the board can't be solved
+                 or is already complete
+        """
+        # the solution is cached, so checking the board first is cheap
+        solution = self.find_solution()
+        if solution is None:
+            return None
+        move = self.next_forced_move()
+        if move is not None:
+            return move
+        stars = set(self.stars)
+        for cell in solution:
+            if cell not in stars:
+                return STAR, cell
+        return None
+
+    def _agrees_with(self, solution: list):
+        """
+        Check if every move made so far agrees with a solution
+        """
+        solution = set(solution)
+        return all((cell in solution) == (kind == STAR) for kind, cell in self.moves)
+
+    def _remove_move(self, move: tuple):
+        """
+        Removes a recorded move. The last applied move is undone directly,
+        any other one by replaying the remaining moves.
+
+        :param move: (STAR or EMPTY, cell) to be removed
+        :return: True if the board is consistent, False otherwise
+        """
+        self.moves.remove(move)  # raises ValueError if the move was never made
+        if self.is_consistent() and self.applied and self.applied[-1][:2] == move:
+            kind, cell, var, changed_domains = self.applied.pop()
+            if kind == STAR:
+                self.csp.unassign_val(var, cell, self.assignment)
+            self.csp.restore_domains(changed_domains)
+        else:
+            self.reset()
+        return self.is_consistent()
+
+    def _apply(self, kind: str, cell: int):
+        """
+        Applies a move to the csp and propagates it, unless the board is
+        already inconsistent
+
+        :param kind: STAR or EMPTY
+        :param cell: cell of the move
+        :return: True if the board is still consistent, False otherwise
+        """
+        if not self.is_consistent():
+            return False
+        csp = self.csp
+        changed_domains = {}
+        # unassigned variables of the block that can still take the cell
+        candidates = [var for var in csp.cell_map[cell].in_domains_of
+                      if var in csp.unassigned_vars and cell in csp.domains[var]]
+
+        if kind == STAR:
+            if not candidates or not csp.is_consistent(cell, self.assignment):
+                self.contradiction = (kind, cell)
+                return False
+            var = candidates[0]
+            csp.assign_val(var, cell, self.assignment)
+            if not csp.propagate_constraints(cell, changed_domains):
+                csp.unassign_val(var, cell, self.assignment)
+                csp.restore_domains(changed_domains)
+                self.contradiction = (kind, cell)
+                return False
+        else:
+            var = None
+            for other in candidates:
+                domain = csp.domains[other]
+                changed_domains[other] = list(domain)
+                domain.discard(cell)
+                if not domain:
+                    csp.restore_domains(changed_domains)
+                    self.contradiction = (kind, cell)
+                    return False
+
+        self.applied.append((kind, cell, var, changed_domains))
+        return True
@@ -0,0 +1,299 @@
+"""
+    File name: solve.py
+    Author: Arsh Khokhar, Kiernan Wiese
+    Date last modified: 19 October, 2026
+    Python Version: 3.8
+
+    This script contains a command line interface for solving arbitrary
+    puzzle files (gridNxN.txt files, JSON corpora in the Examples format or
+    binary corpora) with either algorithm. Results are printed as text or
+    JSON, so it can be used on machines without a display, and can be
+    rendered to image files. Matplotlib is only imported when the gui output
+    or rendering is requested.
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import sys
+import time
+
+import backtrack as backtrack_module
+import forward_checking as forward_checking_module
+
+from backtrack import TIME_LIMIT, backtrack
+from checkpoint import CHECKPOINT_INTERVAL, load_checkpoint, resume
+from forward_checking import forward_check
+from frontier_dp import frontier_solve
+from grid_file_loader import load_grid_file
+from local_search import local_search
+from profiling import SAMPLE_EVERY, Profiler
+from puzzle_corpus import CorpusReader, entry_blocks, load_json_corpus
+
+SOLVERS = {'bt': backtrack, 'fc': forward_check,
+           'ls': lambda blocks, grid_size, heuristic, stars: local_search(blocks, grid_size, stars),
+           'dp': lambda blocks, grid_size, heuristic, stars: frontier_solve(blocks, grid_size, stars)}
+# modules of the solvers that return None after searching everything,
+# leaving the number of checked nodes in the module
+SEARCH_MODULES = {'bt': backtrack_module, 'fc': forward_checking_module}
+EXIT_UNFINISHED = 75  # EX_TEMPFAIL, the search can be resumed from its checkpoint
+
+
+def parse_index(index: str):
+    """
+    Parses a puzzle selection of the form "3" or "start:stop[:step]"
+
+    :param index: selection string, None selects all puzzles
+    :return: slice object for selecting puzzles from a corpus
+    """
+    if index is None:
+        return slice(None)
+    if ':' not in index:
+        return slice(int(index), int(index) + 1 if int(index) != -1 else None)
+    return slice(*[int(part) if part else None for part in index.split(':')])
+
+
+def load_puzzles(path: str, grid_size: int = None, index: str = None, stars: int = 2):
+    """
+    Loads the puzzles contained in a file. The format is picked based on the
+    extension: .json for corpora in the Examples format, .spc for binary
+    corpora, anything else is read as a grid file.
+
+    :param path: path of the puzzle file
+    :param grid_size: size of the grid, for grid files not named gridNxN.txt
+    :param index: selection of puzzles from a corpus (see parse_index)
+    :param stars: number of stars per row, column and block for grid files,
+                  corpora store it for every puzzle
+    :return: list of (name, blocks, grid size, stars) tuples
+    """
+    if path.endswith('.json'):
+        entries = load_json_corpus(path)[parse_index(index)]
+        puzzles = []
+        for entry in entries:
+            puzzles.append((entry.get('puzzle_id', path),) + entry_blocks(entry))
+        return puzzles
+
+    if path.endswith('.spc'):
+        with CorpusReader(path) as reader:
+            return [(puzzle.puzzle_id or '{}[{}]'.format(path, puzzle.index),
+                     puzzle.blocks(), puzzle.grid_size, puzzle.stars)
+                    for puzzle in reader[parse_index(index)]]
+
+    blocks, size = load_grid_file(path, grid_size)
+    return [(path, blocks, size, stars)]
+
+
+def solve_puzzle(blocks: list, grid_size: int, algorithm: str, heuristic: int,
+                 stars: int = 2, **options):
+    """
+    Solves a single puzzle and times it
+
+    :param blocks: 2-D array containing the blocks, and their contents.
+    :param grid_size: Size of the grid (10x10 grid -> 10)
+    :param algorithm: 'bt' for backtracking, 'fc' for forward checking,
+                      'ls' for local search, 'dp' for dynamic programming
+    :param heuristic: The heuristic to be used for the algorithm
+    :param stars: number of stars per row, column and block
+    :param options: time_limit, checkpoint and checkpoint_interval for bt and fc
+    :return: assignment (empty if no solution), checked nodes, run time
+    """
+    start_time = time.time()
+    solution = SOLVERS[algorithm](blocks, grid_size, heuristic, stars, **options)
+    run_time = time.time() - start_time
+    return unpack_solution(solution, lambda: SEARCH_MODULES[algorithm].checked_nodes) + (run_time,)
+
+
+def resume_puzzle(checkpoint: str, time_limit: float = TIME_LIMIT,
+                  checkpoint_interval: float = CHECKPOINT_INTERVAL):
+    """
+    Carries on the search saved in a checkpoint and times it
+
+    :param checkpoint: checkpoint file written by bt or fc
+    :param time_limit: number of seconds the search may run this time
+    :param checkpoint_interval: seconds between checkpoints
+    :return: assignment (empty if no solution), checked nodes over all runs,
+             run time of this run
+    """
+    start_time = time.time()
+    solution = resume(checkpoint, time_limit, checkpoint_interval)
+    run_time = time.time() - start_time
+    # the checkpoint of a finished search holds the nodes of all the runs
+    return unpack_solution(solution, lambda: load_checkpoint(checkpoint)['checked_nodes']) \
+        + (run_time,)
+
+
+def unpack_solution(solution, exhausted_nodes):
+    """
+    Splits the result of a solver into its assignment and checked nodes
+
+    :param solution: result of a solver, (assignment or None, checked nodes),
+                     or None from bt and fc once they searched everything
+    :param exhausted_nodes: function giving the checked nodes when solution is None
+    :return: assignment (empty if no solution), checked nodes
+    """
+    if solution is None:
+        return {}, exhausted_nodes()
+    assignment, checked_nodes = solution
+    return assignment or {}, checked_nodes
+
+
+def format_grid(blocks: list, grid_size: int, star_locs: list):
+    """
+    Formats a grid as text, one letter per block and '*' for stars
+
+    :param blocks: 2-D array containing the blocks, and their contents.
+    :param grid_size: Size of the grid (10x10 grid -> 10)
+    :param star_locs: Locations of stars.
+    :return: the grid as a multi line string
+    """
+    cells = [''] * (grid_size*grid_size + 1)
+    for i, block in enumerate(blocks):
+        for cell in block:
+            cells[cell] = chr(ord('A') + i)
+    for cell in star_locs:
+        cells[cell] = '*'
+    return '\n'.join(' '.join(cells[row*grid_size + 1:(row + 1)*grid_size + 1])
+                     for row in range(grid_size))
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description='Solve 2-star (or k-star) puzzles.')
+    parser.add_argument('files', nargs='*',
+                        help='grid files, JSON corpora (.json) or binary corpora (.spc)')
+    parser.add_argument('-a', '--algorithm', choices=sorted(SOLVERS), default='fc',
+                        help='bt for backtracking, fc for forward checking, '
+                             'ls for local search, dp for row by row dynamic '
+                             'programming (heuristic is ignored by ls and dp)')
+    parser.add_argument('-H', '--heuristic', type=int, choices=range(4), default=1,
+                        help='heuristic type (0,1,2,or 3)')
+    parser.add_argument('-s', '--size', type=int, default=None,
+                        help='grid size, for grid files not named gridNxN.txt')
+    parser.add_argument('-k', '--stars', type=int, default=2,
+                        help='number of stars per row, column and block of grid files')
+    parser.add_argument('-i', '--index', default=None,
+                        help='puzzles to solve from a corpus, e.g. 3 or 0:10')
+    parser.add_argument('-o', '--output', choices=('text', 'json', 'gui'), default='text',
+                        help='how to show the results')
+    parser.add_argument('-r', '--render', default=None, metavar='DIR',
+                        help='also write an image of every result to this directory')
+    parser.add_argument('-f', '--format', default='png',
+                        help='image format of the rendered results (png, svg, ...)')
+    parser.add_argument('-p', '--profile', action='store_true',
+                        help='time the hot paths of the csp and print a summary to stderr')
+    parser.add_argument('--profile-out', default=None, metavar='FILE',
+                        help='also write the profile as collapsed stacks for flamegraph tools')
+    parser.add_argument('--sample-every', type=int, default=SAMPLE_EVERY, metavar='N',
+                        help='time one call in every N calls when profiling')
+    parser.add_argument('-t', '--time-limit', type=float, default=TIME_LIMIT, metavar='SEC',
+                        help='seconds after which bt and fc give up (10 minutes by default)')
+    parser.add_argument('-c', '--checkpoint', default=None, metavar='FILE',
+                        help='write checkpoints of the bt or fc search of a single puzzle '
+                             'to this file, so it can be resumed after the time limit')
+    parser.add_argument('--checkpoint-every', type=float, default=CHECKPOINT_INTERVAL,
+                        metavar='SEC', help='seconds between checkpoints')
+    parser.add_argument('--resume', default=None, metavar='FILE',
+                        help='carry on the search saved in a checkpoint, instead of '
+                             'solving puzzle files')
+    args = parser.parse_args(argv)
+    profiler = Profiler(args.sample_every) if args.profile or args.profile_out else None
+
+    if args.resume:
+        try:
+            saved = load_checkpoint(args.resume)
+        except FileNotFoundError as error:
+            print("Couldn't open {}".format(error.filename), file=sys.stderr)
+            exit(-1)
+        puzzle = saved['puzzle']
+        args.algorithm, args.heuristic = saved['algorithm'], saved['heuristic']
+        puzzles = [(args.resume, puzzle.blocks, puzzle.grid_size, puzzle.stars)]
+    elif not args.files:
+        parser.error('puzzle files are needed unless --resume is given')
+    else:
+        try:
+            puzzles = []
+            for path in args.files:
+                puzzles.extend(load_puzzles(path, args.size, args.index, args.stars))
+        except FileNotFoundError as error:
+            print("Couldn't open {}".format(error.filename), file=sys.stderr)
+            exit(-1)
+        if not puzzles:
+            print('No puzzles selected', file=sys.stderr)
+            exit(-1)
+
+    options = {}
+    if args.algorithm in ('bt', 'fc'):
+        options['time_limit'] = args.time_limit
+    if args.checkpoint:
+        if args.algorithm not in ('bt', 'fc') or len(puzzles) != 1:
+            parser.error('checkpoints need a single puzzle solved with bt or fc')
+        options.update(checkpoint=args.checkpoint, checkpoint_interval=args.checkpoint_every)
+    checkpoint = args.resume or args.checkpoint
+
+    results = []
+    for name, blocks, grid_size, stars in puzzles:
+        if args.resume:
+            solve = functools.partial(resume_puzzle, args.resume, args.time_limit,
+                                      args.checkpoint_every)
+        else:
+            solve = functools.partial(solve_puzzle, blocks, grid_size, args.algorithm,
+                                      args.heuristic, stars, **options)
+        # progress messages of the solvers would break the json output
+        with contextlib.redirect_stdout(sys.stderr if args.output == 'json' else sys.stdout):
+            if profiler:
+                assignment, checked_nodes, run_time = profiler.run(
+                    '{} heuristic {}'.format(args.algorithm, args.heuristic), solve)
+            else:
+                assignment, checked_nodes, run_time = solve()
+        star_locs = sorted(assignment.values())
+        results.append({'name': name,
+                        'grid_size': grid_size,
+                        'stars_per_block': stars,
+                        'solved': bool(star_locs),
+                        'stars': star_locs,
+                        'checked_nodes': checked_nodes,
+                        'run_time': run_time})
+        # without a solution, the checkpoint tells a finished search from a timed out one
+        finished = bool(star_locs) or not checkpoint or \
+            load_checkpoint(checkpoint)['result'] is not None
+        if checkpoint:
+            results[-1]['finished'] = finished
+
+        if args.output == 'text':
+            if finished:
+                outcome = 'solution found' if star_locs else 'no solution found'
+            else:
+                outcome = 'time limit reached, resume with --resume {}'.format(checkpoint)
+            print('{} ({}x{}, {} stars): {} after checking {} nodes in {:.4f} seconds'
+                  .format(name, grid_size, grid_size, stars, outcome, checked_nodes, run_time))
+            print(format_grid(blocks, grid_size, star_locs) + '\n')
+
+    if profiler:
+        print(profiler.format_summary(), file=sys.stderr)
+        if args.profile_out:
+            profiler.write_collapsed(args.profile_out)
+
+    if args.render:
+        # imported here since matplotlib is slow to import
+        from grid_render import render_many
+        render_many(((result['name'], blocks, grid_size, result['stars'])
+                     for (_, blocks, grid_size, _), result in zip(puzzles, results)),
+                    args.render, args.format)
+
+    if args.output == 'json':
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    elif args.output == 'gui':
+        # imported here since matplotlib is slow to import
+        from grid_display import display_grid
+        for i, ((name, blocks, grid_size, _), result) in enumerate(zip(puzzles, results)):
+            display_grid(blocks, grid_size, result['stars'],
+                         title=name if result['solved'] else 'No solution found ' + name,
+                         blocking=i == len(results) - 1)
+
+    if not results[-1].get('finished', True):
+        exit(EXIT_UNFINISHED)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+"""
+    File name: tables.py
+    Author: Arsh Khokhar, Kiernan Wiese
+    Date last modified: 19 October, 2026
+    Python Version: 3.8
+
+    This script contains the formatting of the text tables printed by the
+    benchmark, the profiler and the other command line tools, in the format
+    used in investigation.txt. It has no dependencies, so any module can
+    import it.
+"""
+
+
+def format_table(header: list, rows: list):
+    """
+    Formats rows as a table with the borders used in investigation.txt
+
+    :param header: column titles
+    :param rows: list of rows, each a list of values
+    :return: the table as a multi line string
+    """
+    rows = [[str(value) for value in row] for row in [header] + rows]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    border = '+' + '+'.join('-'*(width + 2) for width in widths) + '+'
+    lines = [border]
+    for row in rows:
+        lines.append('| ' + ' | '.join(value.ljust(width)
+                                       for value, width in zip(row, widths)) + ' |')
+        lines.append(border)
+    return '\n'.join(lines)